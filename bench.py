@@ -0,0 +1,190 @@
+"""BENCH.PY
+Measures how fast the bot answers: runs a fixed set of questions for every graph type
+through generate_answer, main and the streaming path at several concurrency levels,
+and reports latency and time to first token percentiles, tokens and questions per
+second. By default the answers come from a fake Anthropic API started in this process,
+so runs are free and comparable. Results are saved as JSON to compare between commits.
+"""
+
+# Load libraries
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import backend
+import fake_anthropic
+
+
+
+# Questions like the ones the bot gets, a few per graph type
+QUESTIONS = {
+    'bar': [
+        "How do I change the tick size in a horizontal bar graph's categorical axis?",
+        "How do I make the bars vertical and grouped?",
+        "How can I change the colours of the bars and the legend?",
+        "What's the default of legendPosition?",
+        "How do I add labels on top of the bars?",
+        "How does render work?",
+    ],
+    'line': [
+        "How do I change the size of the points on the lines?",
+        "How do I format the numbers on the y axis?",
+        "Can I add a table of the data below the graph?",
+        "What does hoverFade do?",
+        "How do I highlight a line when hovering over the legend?",
+        "How does init work?",
+    ],
+    'map': [
+        "How do I change the colour scale of the provinces?",
+        "How do I add markers for cities?",
+        "How can I zoom into one province when it's clicked?",
+        "What is svg#map1 g.regions?",
+        "How do I show a tooltip with the value of each region?",
+    ],
+    'pie': [
+        "How do I turn the pie chart into a donut?",
+        "How do I show percentages on the slices?",
+        "How can I change the order of the slices?",
+        "What does decimalPlaces do?",
+        "How do I move the legend below the chart?",
+    ],
+}
+
+MODES = ('generate', 'main', 'stream')
+
+def percentile(values: list, share: float) -> float:
+    # Nearest rank, so p99 of a small run is its slowest question
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(share * len(ordered) + 0.5) - 1))]
+
+def ask(mode: str, query: str, graph_type: str, llm, max_context_tokens: int) -> dict:
+    # Latency, time to first token and tokens of one question
+    start = time.perf_counter()
+    first_token = None
+    if mode == 'generate':
+        answer = backend.generate_answer(query, graph_type, llm, max_context_tokens)
+    elif mode == 'main':
+        answer = backend.main(query, graph_type, max_context_tokens, cache_path=None, usage_path=None)
+    else:
+        answer = None
+        for chunk in backend.stream_answer(query, graph_type, llm, max_context_tokens):
+            if chunk.content and first_token is None:
+                first_token = time.perf_counter() - start
+            answer = chunk if answer is None else answer + chunk
+    latency = time.perf_counter() - start
+    return {"latency_s": latency, "ttft_s": first_token if first_token is not None else latency,
+            "fast_path": answer.response_metadata.get("fast_path", False), **backend.token_usage(answer)}
+
+def run_level(mode: str, concurrency: int, llm, max_context_tokens: int, repeat: int = 1) -> dict:
+    questions = [(query, graph_type) for _ in range(repeat)
+                 for graph_type, queries in QUESTIONS.items() for query in queries]
+
+    def timed(question):
+        try:
+            return ask(mode, question[0], question[1], llm, max_context_tokens)
+        except Exception as error:
+            return {"error": f"{type(error).__name__}: {error}"}
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(timed, questions))
+    wall = time.perf_counter() - start
+
+    answered = [result for result in results if "error" not in result]
+    latencies = [result["latency_s"] for result in answered]
+    ttfts = [result["ttft_s"] for result in answered]
+    row = {"mode": mode, "concurrency": concurrency, "questions": len(results),
+           "errors": len(results) - len(answered), "fast_path": sum(result["fast_path"] for result in answered),
+           "wall_s": round(wall, 3), "qps": round(len(answered) / wall, 2) if wall else 0.0}
+    for name, values in (("latency", latencies), ("ttft", ttfts)):
+        for share in (0.5, 0.95, 0.99):
+            row[f"{name}_p{round(share * 100)}_s"] = round(percentile(values, share), 4)
+    for key in ("input_tokens", "output_tokens", "cache_creation_input_tokens", "cache_read_input_tokens"):
+        row[key] = sum(result[key] for result in answered)
+    return row
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+def compare(old: dict, new: dict, tolerance: float = 0.1) -> list:
+    # Relative change of the main numbers for every (mode, concurrency) in both runs,
+    # marking slowdowns bigger than `tolerance` as regressions
+    before = {(row["mode"], row["concurrency"]): row for row in old["results"]}
+    report = []
+    for row in new["results"]:
+        previous = before.get((row["mode"], row["concurrency"]))
+        if previous is None:
+            continue
+        changes = {}
+        for key in ("latency_p50_s", "latency_p95_s", "latency_p99_s", "ttft_p50_s", "qps", "input_tokens"):
+            if previous[key]:
+                changes[key] = round(row[key] / previous[key] - 1, 3)
+        slower = [key for key, change in changes.items()
+                  if (change < -tolerance if key == "qps" else change > tolerance)]
+        report.append({"mode": row["mode"], "concurrency": row["concurrency"], "changes": changes,
+                       "regressions": slower})
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-m", "--modes", help="Paths to measure", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("-c", "--concurrency", help="How many questions are asked at once", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("-r", "--repeat", help="How many times each question is asked per level", type=int, default=1)
+    parser.add_argument("-t", "--max-context-tokens", type=int, default=backend.MAX_CONTEXT_TOKENS)
+    parser.add_argument("--api-url", help="Measure against this Messages API instead of a fake one", type=str)
+    parser.add_argument("--record", help="Keep the responses in this file, to replay them in later runs", type=str)
+    parser.add_argument("--replay", help="Answer from the responses recorded in this file, without any API", type=str)
+    parser.add_argument("--replay-speed", help="How many times faster than recorded to replay (0 doesn't wait)", type=float, default=1.0)
+    parser.add_argument("--no-fast-path", help="Send lookup questions to the model too", action="store_true")
+    parser.add_argument("-o", "--output", help="Where to save the results as JSON", type=str)
+    parser.add_argument("--compare", help="Earlier results to compare with", type=str)
+    parser.add_argument("--tolerance", help="Relative slowdown reported as a regression", type=float, default=0.1)
+    fake_anthropic.add_arguments(parser)
+    args = parser.parse_args()
+
+    if args.no_fast_path:
+        backend.FAST_PATH = False
+    if args.record or args.replay:
+        backend.CASSETTE_PATH, backend.CASSETTE_MODE = (args.record, "record") if args.record else (args.replay, "replay")
+        backend.REPLAY_SPEED = args.replay_speed
+    if args.api_url or args.replay:
+        backend.API_URL = args.api_url
+    else:
+        server, backend.API_URL = fake_anthropic.serve_in_thread(config=fake_anthropic.config_from_args(args))
+    backend.ANTHROPIC_KEY = backend.ANTHROPIC_KEY or "fake"
+    llm = backend.load_llm(backend.ANTHROPIC_KEY, backend.API_URL)
+
+    # Build the indexes first so the first level doesn't pay for them
+    for graph_type in backend.GRAPH_TYPES:
+        backend.build_context("warm up", graph_type)
+    backend.load_symbols()
+
+    results = []
+    for mode in args.modes:
+        for concurrency in args.concurrency:
+            row = run_level(mode, concurrency, llm, args.max_context_tokens, args.repeat)
+            results.append(row)
+            print(json.dumps(row), file=sys.stderr)
+
+    run = {"commit": git_commit(), "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": platform.python_version(),
+           "api_url": f"replay {args.replay}" if args.replay else args.api_url or "fake", "config": {key: value for key, value in vars(args).items()
+                                                        if key not in ("output", "compare")},
+           "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(run, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            for row in compare(json.load(f), run, args.tolerance):
+                print(json.dumps(row))
@@ -0,0 +1,301 @@
+"""CACHE.PY
+Keeps the answers to questions that were already asked, so asking again doesn't need the model.
+Answers live in a SQLite database in WAL mode, so several Streamlit processes can share it.
+Paraphrased questions are matched by the similarity of their TF-IDF vectors.
+"""
+
+# Load libraries
+import re
+import json
+import math
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from collections import Counter
+
+from retrieval import STOP_WORDS, tokenize
+
+
+
+def normalize_question(query: str) -> str:
+    # Case, spacing and trailing punctuation don't change the question
+    return re.sub(r"\s+", " ", query).strip().strip("?!.").strip().lower()
+
+def cache_scope(graph_type: str, corpus_hash: str, params: dict) -> str:
+    # Answers are only reused within the same graph, corpus and model settings
+    scope = {"graph_type": graph_type, "corpus": corpus_hash, "params": params}
+    return hashlib.sha256(json.dumps(scope, sort_keys=True).encode()).hexdigest()
+
+def cache_key(query: str, scope: str) -> str:
+    return hashlib.sha256(f"{scope}\0{normalize_question(query)}".encode()).hexdigest()
+
+
+class Database:
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared between threads, so each thread opens its own
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=10)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+
+class AnswerCache(Database):
+    def __init__(self, path: str, ttl: float = 7 * 24 * 3600, max_entries: int = 10000):
+        super().__init__(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        with self._connection() as db:
+            db.execute("""CREATE TABLE IF NOT EXISTS answers (
+                key TEXT PRIMARY KEY,
+                answer TEXT NOT NULL,
+                created REAL NOT NULL,
+                last_used REAL NOT NULL
+            )""")
+            db.execute("CREATE INDEX IF NOT EXISTS answers_last_used ON answers (last_used)")
+
+    def get(self, key: str):
+        # The answer, or None if it isn't cached or has expired
+        now = time.time()
+        with self._connection() as db:
+            row = db.execute("SELECT answer FROM answers WHERE key = ? AND created > ?",
+                             (key, now - self.ttl)).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE answers SET last_used = ? WHERE key = ?", (now, key))
+        return row[0]
+
+    def put(self, key: str, answer: str):
+        now = time.time()
+        with self._connection() as db:
+            db.execute("INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?)", (key, answer, now, now))
+            self._evict(db, now)
+
+    def _evict(self, db: sqlite3.Connection, now: float):
+        # Drop expired answers, then the least recently used ones over the limit
+        db.execute("DELETE FROM answers WHERE created <= ?", (now - self.ttl,))
+        extra = db.execute("SELECT COUNT(*) FROM answers").fetchone()[0] - self.max_entries
+        if extra > 0:
+            db.execute("DELETE FROM answers WHERE key IN "
+                       "(SELECT key FROM answers ORDER BY last_used LIMIT ?)", (extra,))
+
+    def clear(self):
+        with self._connection() as db:
+            db.execute("DELETE FROM answers")
+
+
+# Paraphrased questions
+
+# Words that say how something is asked rather than what, so two questions
+# shouldn't look alike just because both use them
+QUESTION_WORDS = {
+    "change", "make", "set", "setting", "use", "using", "want", "way", "need", "possible", "there",
+    "would", "could", "should", "like", "graph", "chart", "code", "justin",
+}
+
+# Words that flip what a question asks for. They're kept even where tokenize()
+# drops them as stop words and weigh at least as much as the rarest term, so
+# "turn on"/"turn off" or "x axis"/"y axis" don't look like the same question
+CONTRAST_WORDS = {
+    "on", "off", "show", "hide", "hidden", "visible", "x", "y", "add", "remove", "enable", "disable",
+    "not", "no", "without", "top", "bottom", "left", "right", "horizontal", "vertical", "above",
+    "below", "inside", "outside", "increase", "decrease", "min", "max", "first", "last",
+}
+
+# Questions that must never be answered with each other's answer
+CONFUSABLE_PAIRS = [
+    ("How do I turn on tooltips in the bar graph?", "How do I turn off tooltips in the bar graph?"),
+    ("How do I change the tick size on the x axis?", "How do I change the tick size on the y axis?"),
+    ("How do I change the title font size?", "How do I change the axis title font size?"),
+    ("How do I show the legend?", "How do I hide the legend?"),
+    ("How do I add labels on top of the bars?", "How do I remove labels on top of the bars?"),
+    ("How do I make the bars vertical?", "How do I make the bars horizontal?"),
+    ("How do I put the legend on the left?", "How do I put the legend on the right?"),
+]
+
+class HashedTfidf:
+    # Turns a question into a sparse, unit length TF-IDF vector. Terms are hashed
+    # into a fixed number of dimensions so no vocabulary has to be kept, and
+    # weighed by how rare they are in the source code and documentation.
+    def __init__(self, idf: dict, dimensions: int = 2 ** 18):
+        self.idf = idf
+        self.default_idf = max(idf.values(), default=1.0)
+        self.dimensions = dimensions
+
+    def __call__(self, text: str) -> dict:
+        terms = [term for term in tokenize(text) if term not in QUESTION_WORDS]
+        terms.extend(word for word in re.findall(r"[a-z]+", text.lower()) if word in CONTRAST_WORDS & STOP_WORDS)
+        vector = {}
+        for term, count in Counter(terms).items():
+            bucket = zlib.crc32(term.encode()) % self.dimensions
+            idf = self.idf.get(term, self.default_idf)
+            if term in CONTRAST_WORDS:
+                idf = max(idf, self.default_idf)
+            weight = (1 + math.log(count)) * idf
+            vector[bucket] = vector.get(bucket, 0.0) + weight
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+        return {bucket: weight / norm for bucket, weight in vector.items()}
+
+def cosine(a: dict, b: dict) -> float:
+    # Both vectors are unit length
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(weight * b.get(bucket, 0.0) for bucket, weight in a.items())
+
+
+class SemanticCache(Database):
+    # Answers a question with the answer to an earlier, similar enough question
+    # about the same graph. Questions are stored in SQLite next to the exact
+    # answers; each process keeps their vectors in memory and only reads the
+    # rows other processes added since its last lookup.
+    def __init__(self, path: str, vectorizer: HashedTfidf, threshold: float = 0.95,
+                 ttl: float = 7 * 24 * 3600, max_entries: int = 10000):
+        super().__init__(path)
+        self.vectorizer = vectorizer
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}  # scope -> [(created, vector, answer)], oldest first
+        self._last_id = 0
+        self._lock = threading.Lock()
+        with self._connection() as db:
+            db.execute("""CREATE TABLE IF NOT EXISTS questions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                scope TEXT NOT NULL,
+                question TEXT NOT NULL,
+                answer TEXT NOT NULL,
+                created REAL NOT NULL
+            )""")
+            # Older files stored each question's vector too. Questions are vectorized
+            # again when read, so they're compared the same way as new ones after
+            # the vectorizer changes, and the column was never read.
+            columns = [row[1] for row in db.execute("PRAGMA table_info(questions)")]
+            if "vector" in columns:
+                db.execute("ALTER TABLE questions DROP COLUMN vector")
+
+    def _refresh(self, oldest: float):
+        # Reads the rows other processes added, then drops expired entries and the
+        # oldest ones over max_entries per scope
+        rows = self._connection().execute(
+            "SELECT id, scope, created, question, answer FROM questions WHERE id > ? AND created > ? ORDER BY id",
+            (self._last_id, oldest)).fetchall()
+        for row_id, scope, created, question, answer in rows:
+            self._entries.setdefault(scope, []).append((created, self.vectorizer(question), answer))
+            self._last_id = row_id
+        for scope, entries in list(self._entries.items()):
+            entries = [entry for entry in entries[-self.max_entries:] if entry[0] > oldest]
+            if entries:
+                self._entries[scope] = entries
+            else:
+                del self._entries[scope]
+
+    def search(self, query: str, scope: str):
+        # (similarity, answer) of the closest earlier question in the scope, or None
+        vector = self.vectorizer(query)
+        with self._lock:
+            self._refresh(time.time() - self.ttl)
+            entries = self._entries.get(scope, [])
+            best = max(((cosine(vector, other), answer) for created, other, answer in entries),
+                       default=None, key=lambda pair: pair[0])
+        return best
+
+    def get(self, query: str, scope: str):
+        # The earlier answer if its question is at least `threshold` similar, else None
+        best = self.search(query, scope)
+        hit = best is not None and best[0] >= self.threshold
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return best[1] if hit else None
+
+    def put(self, query: str, scope: str, answer: str):
+        now = time.time()
+        with self._connection() as db:
+            db.execute("INSERT INTO questions (scope, question, answer, created) VALUES (?, ?, ?, ?)",
+                       (scope, query, answer, now))
+            db.execute("DELETE FROM questions WHERE created <= ?", (now - self.ttl,))
+            db.execute("DELETE FROM questions WHERE scope = ? AND id NOT IN "
+                       "(SELECT id FROM questions WHERE scope = ? ORDER BY id DESC LIMIT ?)",
+                       (scope, scope, self.max_entries))
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {"hits": hits, "misses": misses, "hit_rate": hits / total if total else 0.0,
+                "threshold": self.threshold}
+
+
+def sweep_thresholds(questions: list, vectorizer: HashedTfidf, thresholds: list) -> list:
+    # Replays logged (graph_type, question) pairs in order and reports, for each
+    # threshold, how often a question would have been answered from an earlier
+    # one and the least similar pair that would have matched, to eyeball for
+    # false matches.
+    vectors = [(graph_type, question, vectorizer(question)) for graph_type, question in questions]
+    best = []
+    for i, (graph_type, question, vector) in enumerate(vectors):
+        earlier = [(cosine(vector, other), other_question) for other_graph, other_question, other in vectors[:i]
+                   if other_graph == graph_type]
+        best.append((max(earlier, default=(0.0, None)), question))
+
+    report = []
+    for threshold in thresholds:
+        matches = [(similarity, other, question) for (similarity, other), question in best if similarity >= threshold]
+        report.append({
+            "threshold": threshold,
+            "hit_rate": len(matches) / len(best) if best else 0.0,
+            "weakest_match": min(matches, default=None),
+        })
+    return report
+
+def confusable_matches(vectorizer: HashedTfidf, threshold: float, pairs: list = CONFUSABLE_PAIRS) -> list:
+    # (similarity, question, other) of the pairs that would wrongly share an answer at `threshold`
+    similar = [(cosine(vectorizer(question), vectorizer(other)), question, other) for question, other in pairs]
+    return [match for match in similar if match[0] >= threshold]
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+    from backend import question_vectorizer, SEMANTIC_THRESHOLD
+
+    parser = argparse.ArgumentParser(description="Shows how often logged questions would be answered by the semantic cache at different thresholds")
+    parser.add_argument("log", help="A frontend log file, or JSONL with 'query' and 'graph' keys", nargs="?")
+    parser.add_argument("--thresholds", help="Similarity thresholds to try", type=float, nargs="+",
+                        default=[0.6, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95, 0.98])
+    parser.add_argument("--check", help="Exit with an error if any of CONFUSABLE_PAIRS would share an answer at the default threshold", action="store_true")
+    args = parser.parse_args()
+
+    if args.check:
+        matches = confusable_matches(question_vectorizer(), SEMANTIC_THRESHOLD)
+        for match in matches:
+            print(json.dumps({"similarity": round(match[0], 3), "question": match[1], "other": match[2]}))
+        print(f"{len(matches)} of {len(CONFUSABLE_PAIRS)} confusable pairs match at {SEMANTIC_THRESHOLD}", file=sys.stderr)
+        sys.exit(1 if matches else 0)
+    if not args.log:
+        parser.error("either a log or --check is needed")
+
+    questions = []
+    with open(args.log) as log:
+        for line in log:
+            logged = re.search(r"Question \((\w+)\): (.*)", line)
+            if logged:
+                questions.append((logged.group(1), logged.group(2)))
+            elif line.startswith("{"):
+                item = json.loads(line)
+                questions.append((item.get("graph", "bar"), item["query"]))
+
+    for row in sweep_thresholds(questions, question_vectorizer(), args.thresholds):
+        print(json.dumps(row))
@@ -0,0 +1,202 @@
+"""CASSETTE.PY
+Records the bot's requests to the Anthropic API and their responses, and replays them
+later without the network. Works at the httpx transport level, so every path (invoke,
+stream, sync and async) is covered. Responses are keyed by a hash of the request and
+kept zlib compressed in SQLite, with the time every piece of the body arrived, so a
+replay can keep the original timing (time to first token included) or run faster.
+"""
+
+# Load libraries
+import json
+import time
+import zlib
+import asyncio
+import hashlib
+import httpx
+
+from cache import Database
+
+
+
+def request_key(request: httpx.Request) -> str:
+    # Same method, path and JSON body is the same request, whichever host or headers it's sent with
+    body = request.read()
+    try:
+        body = json.dumps(json.loads(body), sort_keys=True).encode()
+    except ValueError:
+        pass
+    return hashlib.sha256(request.method.encode() + b" " + request.url.path.encode() + b"\0" + body).hexdigest()
+
+
+class Recording:
+    # The pieces of a response body with when each arrived, in seconds after the request was sent
+    def __init__(self, status: int, headers: list, headers_s: float):
+        self.status = status
+        self.headers = headers
+        self.headers_s = headers_s
+        self.pieces = []  # (offset, bytes)
+
+    def delays(self, speed: float) -> list:
+        # (seconds to wait, bytes) for each piece, replayed `speed` times faster, 0 doesn't wait at all
+        delays = []
+        previous = self.headers_s
+        for offset, piece in self.pieces:
+            delays.append(((offset - previous) / speed if speed > 0 else 0.0, piece))
+            previous = offset
+        return delays
+
+class RecordingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    # Passes a live response body through while noting what arrives when, and saves it once read
+    def __init__(self, stream, recording: Recording, start: float, save):
+        self.stream = stream
+        self.recording = recording
+        self.start = start
+        self.save = save
+
+    def __iter__(self):
+        for piece in self.stream:
+            self.recording.pieces.append((time.perf_counter() - self.start, piece))
+            yield piece
+        self.save(self.recording)
+
+    async def __aiter__(self):
+        async for piece in self.stream:
+            self.recording.pieces.append((time.perf_counter() - self.start, piece))
+            yield piece
+        self.save(self.recording)
+
+    def close(self):
+        self.stream.close()
+
+    async def aclose(self):
+        await self.stream.aclose()
+
+class ReplayStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, delays: list):
+        self.delays = delays
+
+    def __iter__(self):
+        for delay, piece in self.delays:
+            if delay > 0:
+                time.sleep(delay)
+            yield piece
+
+    async def __aiter__(self):
+        for delay, piece in self.delays:
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield piece
+
+
+class Cassette(Database):
+    # mode is 'record' (send requests and keep the responses) or 'replay' (answer
+    # from kept responses, a request that wasn't recorded gets a 404 error)
+    def __init__(self, path: str, mode: str = "replay", speed: float = 1.0):
+        super().__init__(path)
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode {mode!r}, use 'record' or 'replay'")
+        self.mode = mode
+        self.speed = speed
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+        with self._connection() as db:
+            db.execute("""CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                headers_s REAL NOT NULL,
+                timings TEXT NOT NULL,
+                body BLOB NOT NULL,
+                recorded REAL NOT NULL
+            )""")
+
+    def save(self, key: str, recording: Recording):
+        # Retried requests are recorded again, so the last (usually successful) response is kept
+        timings = [(round(offset, 4), len(piece)) for offset, piece in recording.pieces]
+        body = zlib.compress(b"".join(piece for offset, piece in recording.pieces))
+        with self._connection() as db:
+            db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       (key, recording.status, json.dumps(recording.headers), recording.headers_s,
+                        json.dumps(timings), body, time.time()))
+        self.recorded += 1
+
+    def load(self, key: str):
+        row = self._connection().execute(
+            "SELECT status, headers, headers_s, timings, body FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        status, headers, headers_s, timings, body = row
+        recording = Recording(status, [tuple(header) for header in json.loads(headers)], headers_s)
+        body = zlib.decompress(body)
+        position = 0
+        for offset, length in json.loads(timings):
+            recording.pieces.append((offset, body[position:position + length]))
+            position += length
+        return recording
+
+    def _miss(self, request: httpx.Request) -> httpx.Response:
+        self.misses += 1
+        return httpx.Response(404, json={"type": "error", "error": {
+            "type": "not_found_error", "message": f"No recorded response for {request.method} {request.url.path} in {self.path}"}})
+
+    def _replay(self, recording: Recording) -> httpx.Response:
+        self.hits += 1
+        return httpx.Response(recording.status, headers=recording.headers, stream=ReplayStream(recording.delays(self.speed)))
+
+    def _recorded(self, key: str, response: httpx.Response, start: float) -> httpx.Response:
+        headers = [(name.decode("latin-1"), value.decode("latin-1")) for name, value in response.headers.raw]
+        recording = Recording(response.status_code, headers, time.perf_counter() - start)
+        stream = RecordingStream(response.stream, recording, start, lambda recording: self.save(key, recording))
+        return httpx.Response(response.status_code, headers=response.headers, stream=stream,
+                              extensions=response.extensions)
+
+    def transport(self, inner: httpx.BaseTransport = None) -> httpx.BaseTransport:
+        # A sync transport that records through `inner` or replays
+        return CassetteTransport(self, inner or httpx.HTTPTransport())
+
+    def async_transport(self, inner: httpx.AsyncBaseTransport = None) -> httpx.AsyncBaseTransport:
+        return AsyncCassetteTransport(self, inner or httpx.AsyncHTTPTransport())
+
+    def stats(self) -> dict:
+        return {"mode": self.mode, "hits": self.hits, "misses": self.misses, "recorded": self.recorded}
+
+class CassetteTransport(httpx.BaseTransport):
+    def __init__(self, cassette: Cassette, inner: httpx.BaseTransport):
+        self.cassette = cassette
+        self.inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request)
+        if self.cassette.mode == "replay":
+            recording = self.cassette.load(key)
+            if recording is None:
+                return self.cassette._miss(request)
+            if recording.headers_s > 0 and self.cassette.speed > 0:
+                time.sleep(recording.headers_s / self.cassette.speed)
+            return self.cassette._replay(recording)
+        start = time.perf_counter()
+        return self.cassette._recorded(key, self.inner.handle_request(request), start)
+
+    def close(self):
+        self.inner.close()
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    def __init__(self, cassette: Cassette, inner: httpx.AsyncBaseTransport):
+        self.cassette = cassette
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request)
+        if self.cassette.mode == "replay":
+            recording = self.cassette.load(key)
+            if recording is None:
+                return self.cassette._miss(request)
+            if recording.headers_s > 0 and self.cassette.speed > 0:
+                await asyncio.sleep(recording.headers_s / self.cassette.speed)
+            return self.cassette._replay(recording)
+        start = time.perf_counter()
+        return self.cassette._recorded(key, await self.inner.handle_async_request(request), start)
+
+    async def aclose(self):
+        await self.inner.aclose()
@@ -0,0 +1,173 @@
+"""CHUNKING.PY
+Splits the source code and documentation of a graph into small chunks
+that can be searched and sent to the model on their own
+"""
+
+# Load libraries
+import re
+from dataclasses import dataclass
+
+
+
+@dataclass(frozen=True)
+class Chunk:
+    graph_type: str
+    kind: str  # 'source' or 'documentation'
+    title: str
+    text: str
+    start_line: int  # 1-based, inclusive
+    end_line: int
+    class_name: str = ""
+    name: str = ""  # method name, '#' kept for private methods
+    signature: str = ""
+    region: str = ""
+
+
+# Line based chunks
+
+def _blocks(lines: list) -> list:
+    # (start, end) line indices of runs of non-blank lines, ``` fences are kept whole
+    blocks = []
+    start = None
+    in_fence = False
+    for i, line in enumerate(lines):
+        if line.strip().startswith("```"):
+            in_fence = not in_fence
+        if line.strip() and start is None:
+            start = i
+        elif not line.strip() and start is not None and not in_fence:
+            blocks.append((start, i))
+            start = None
+    if start is not None:
+        blocks.append((start, len(lines)))
+    return blocks
+
+def chunk_lines(graph_type: str, kind: str, text: str, max_lines: int = 60) -> list:
+    # Groups blank-line separated blocks until a chunk reaches max_lines
+    lines = text.split("\n")
+    chunks = []
+    group = []
+
+    def flush():
+        if group:
+            start, end = group[0][0], group[-1][1]
+            body = "\n".join(lines[start:end])
+            title = body.strip().split("\n")[0].strip()[:80]
+            chunks.append(Chunk(graph_type, kind, title, body, start + 1, end))
+            group.clear()
+
+    for block in _blocks(lines):
+        if group and block[1] - group[0][0] > max_lines:
+            flush()
+        group.append(block)
+    flush()
+    return chunks
+
+
+# Source code
+
+CLASS_RE = re.compile(r"^(export\s+)?class\s+(\w+)")
+METHOD_RE = re.compile(r"^((?:static\s+|async\s+|get\s+|set\s+)*(#?[\w$]+)\s*\(.*\))\s*\{\s*(//.*)?$")
+BANNER_RE = re.compile(r"^//\s*(#region\b)?\s*=+\s*(.*?)\s*=+")
+REGION_RE = re.compile(r"^//\s*#region\s+(.*)$")
+ENDREGION_RE = re.compile(r"^//\s*#?endregion")
+
+def _region_name(comment: str) -> str:
+    banner = BANNER_RE.match(comment)
+    if banner:
+        return banner.group(2)
+    region = REGION_RE.match(comment)
+    return region.group(1).strip() if region else ""
+
+def chunk_source(graph_type: str, source: str, max_lines: int = 120) -> list:
+    # One chunk per class method, with the fields and comments between methods
+    # kept as their own chunks. Methods are found by their indentation, which is
+    # consistent in all the graph classes: a method starts with `name(args) {`
+    # one level inside the class and ends at the `}` on the same level.
+    lines = source.split("\n")
+    class_line = next((i for i, line in enumerate(lines) if CLASS_RE.match(line)), None)
+    if class_line is None:
+        return chunk_lines(graph_type, "source", source)
+    class_name = CLASS_RE.match(lines[class_line]).group(2)
+    indent = next(re.match(r"\s*", line).group() for line in lines[class_line + 1:] if line.strip())
+
+    chunks = []
+    region = ""
+
+    def add(start, end, title, name="", signature=""):
+        # start/end are 0-based line indices, end exclusive. Region banners and
+        # closing braces on their own aren't worth a chunk.
+        if all(not line.strip() or line.strip() == "}" or _region_name(line.strip()) or ENDREGION_RE.match(line.strip())
+               for line in lines[start:end]):
+            return
+        text = "\n".join(lines[start:end])
+        if end - start <= max_lines:
+            pieces = [Chunk(graph_type, "source", title, text, 1, end - start)]
+        else:
+            # Very long methods are split between blocks so they still fit a budget
+            pieces = chunk_lines(graph_type, "source", text, max_lines)
+        for part, piece in enumerate(pieces):
+            chunks.append(Chunk(graph_type, "source", title if part == 0 else f"{title} (part {part + 1})",
+                                piece.text, piece.start_line + start, piece.end_line + start,
+                                class_name, name, signature, region))
+
+    def gap_title():
+        if not any(chunk.name for chunk in chunks):
+            return f"{class_name} fields"
+        return f"{class_name} ({region or 'members'})"
+
+    add(0, class_line + 1, f"{class_name} file header")
+
+    gap_start = class_line + 1
+    i = class_line + 1
+    while i < len(lines):
+        line = lines[i]
+        member = line[len(indent):] if line.startswith(indent) and not line[len(indent):][:1].isspace() else ""
+
+        if member.startswith("//") and _region_name(member):
+            add(gap_start, i, gap_title())
+            region = _region_name(member)
+            gap_start = i
+        elif ENDREGION_RE.match(member):
+            add(gap_start, i, gap_title())
+            region = ""
+            gap_start = i
+        elif METHOD_RE.match(member):
+            add(gap_start, i, gap_title())
+            signature, name = METHOD_RE.match(member).group(1, 2)
+            end = next((j for j in range(i + 1, len(lines)) if lines[j].rstrip() == indent + "}"), len(lines) - 1)
+            add(i, end + 1, f"{class_name}.{signature}", name, signature)
+            gap_start = i = end + 1
+            continue
+        i += 1
+
+    add(gap_start, len(lines), gap_title())
+    return chunks
+
+
+# Documentation
+
+HEADING_RE = re.compile(r"^#+\s*\S")
+
+def chunk_documentation(graph_type: str, documentation: str, max_lines: int = 40) -> list:
+    # One chunk per markdown section, long sections are split between paragraphs.
+    # Lines inside ``` fences are never treated as headings.
+    lines = documentation.split("\n")
+    sections = []
+    start = 0
+    in_fence = False
+    for i, line in enumerate(lines):
+        if line.strip().startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence and HEADING_RE.match(line) and i > start:
+            sections.append((start, i))
+            start = i
+    sections.append((start, len(lines)))
+
+    chunks = []
+    for start, end in sections:
+        heading = lines[start].strip() if HEADING_RE.match(lines[start]) else ""
+        for chunk in chunk_lines(graph_type, "documentation", "\n".join(lines[start:end]), max_lines):
+            chunks.append(Chunk(graph_type, "documentation", heading or chunk.title, chunk.text,
+                                chunk.start_line + start, chunk.end_line + start))
+    return chunks
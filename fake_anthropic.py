@@ -0,0 +1,198 @@
+"""FAKE_ANTHROPIC.PY
+A local stand-in for the Anthropic Messages API, so the bot can be load tested and
+benchmarked on one machine without spending API quota. It answers every request with
+filler text after a configurable delay, streams like the real API, fails a configurable
+share of requests, and reports token usage including prompt cache reads and writes.
+Point the bot at it with `--api-url` or the ANTHROPIC_API_URL environment variable.
+"""
+
+# Load libraries
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from retrieval import estimate_tokens
+
+
+
+FILLER = ("I built this so you can set it with a chaining method before calling init(), "
+          "then call render() to draw the graph with the new setting.").split()
+
+class FakeConfig:
+    # Seconds before the first token, plus per input token (reading the prompt)
+    # and per output token (writing the answer), like the real API's latency
+    def __init__(self, latency: float = 0.2, input_token_latency: float = 0.000005,
+                 output_token_latency: float = 0.005, output_tokens: int = 200, error_rate: float = 0.0,
+                 error_status: int = 529, seed: int = None):
+        self.latency = latency
+        self.input_token_latency = input_token_latency
+        self.output_token_latency = output_token_latency
+        self.output_tokens = output_tokens
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.random = random.Random(seed)
+        self.cached_prefixes = set()
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+ERRORS = {
+    429: ("rate_limit_error", "Number of request tokens has exceeded your per-minute rate limit"),
+    500: ("api_error", "Internal server error"),
+    529: ("overloaded_error", "Overloaded"),
+}
+
+def usage_for(body: dict, config: FakeConfig) -> dict:
+    # Input tokens, split like the real API into uncached ones and the cacheable
+    # prefix (up to the last block marked with cache_control) being written or read
+    blocks = []
+    system = body.get("system") or []
+    blocks.extend([{"type": "text", "text": system}] if isinstance(system, str) else system)
+    for message in body.get("messages", []):
+        content = message["content"]
+        blocks.extend([{"type": "text", "text": content}] if isinstance(content, str) else content)
+
+    last_cached = max((i for i, block in enumerate(blocks) if block.get("cache_control")), default=-1)
+    prefix = "".join(block.get("text", "") for block in blocks[:last_cached + 1])
+    rest = "".join(block.get("text", "") for block in blocks[last_cached + 1:])
+    usage = {"input_tokens": estimate_tokens(rest), "output_tokens": 0,
+             "cache_creation_input_tokens": 0, "cache_read_input_tokens": 0}
+    if prefix:
+        key = hashlib.sha256(prefix.encode()).hexdigest()
+        with config.lock:
+            cached = key in config.cached_prefixes
+            config.cached_prefixes.add(key)
+        usage["cache_read_input_tokens" if cached else "cache_creation_input_tokens"] = estimate_tokens(prefix)
+    return usage
+
+def answer_words(body: dict, config: FakeConfig) -> list:
+    # Filler answer of about `output_tokens` tokens, one word (about a token) per streamed delta
+    count = min(config.output_tokens, body.get("max_tokens", config.output_tokens))
+    return [("" if i == 0 else " ") + FILLER[i % len(FILLER)] for i in range(count)]
+
+
+class FakeAnthropicHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API, so the bot's connection pool is exercised
+    config = FakeConfig()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: dict):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(data)))
+        self.send_header("request-id", f"req_fake_{time.time_ns()}")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_event(self, event: dict):
+        data = f"event: {event['type']}\ndata: {json.dumps(event)}\n\n".encode()
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("content-length", 0))) or b"{}")
+        if not self.path.rstrip("/").endswith("/v1/messages"):
+            self._send_json(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+            return
+
+        config = self.config
+        with config.lock:
+            config.requests += 1
+            failed = config.random.random() < config.error_rate
+            config.errors += failed
+        if failed:
+            kind, message = ERRORS.get(config.error_status, ERRORS[500])
+            self._send_json(config.error_status, {"type": "error", "error": {"type": kind, "message": message}})
+            return
+
+        usage = usage_for(body, config)
+        words = answer_words(body, config)
+        prompt_tokens = usage["input_tokens"] + usage["cache_creation_input_tokens"] + usage["cache_read_input_tokens"]
+        time.sleep(config.latency + prompt_tokens * config.input_token_latency)
+
+        message = {"id": f"msg_fake_{time.time_ns()}", "type": "message", "role": "assistant",
+                   "model": body.get("model", "fake"), "content": [], "stop_reason": None,
+                   "stop_sequence": None, "usage": usage}
+        if not body.get("stream"):
+            time.sleep(len(words) * config.output_token_latency)
+            message["content"] = [{"type": "text", "text": "".join(words)}]
+            message["stop_reason"] = "end_turn"
+            message["usage"] = dict(usage, output_tokens=len(words))
+            self._send_json(200, message)
+            return
+
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("transfer-encoding", "chunked")
+        self.end_headers()
+        self._send_event({"type": "message_start", "message": message})
+        self._send_event({"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}})
+        for word in words:
+            time.sleep(config.output_token_latency)
+            self._send_event({"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": word}})
+        self._send_event({"type": "content_block_stop", "index": 0})
+        self._send_event({"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                          "usage": {"output_tokens": len(words)}})
+        self._send_event({"type": "message_stop"})
+        self.wfile.write(b"0\r\n\r\n")
+
+
+class FakeAnthropicServer(ThreadingHTTPServer):
+    def handle_error(self, request, client_address):
+        # Clients hanging up mid-answer (a cancelled stream, the end of a load test)
+        # are expected; anything else gets one line instead of a traceback
+        error = sys.exc_info()[1]
+        if isinstance(error, (ConnectionResetError, BrokenPipeError)):
+            return
+        print(f"Fake Anthropic API: {type(error).__name__}: {error} ({client_address[0]}:{client_address[1]})",
+              file=sys.stderr)
+
+def make_server(host: str = "127.0.0.1", port: int = 0, config: FakeConfig = None) -> ThreadingHTTPServer:
+    # Each server gets its own handler class so servers don't share a config
+    handler = type("Handler", (FakeAnthropicHandler,), {"config": config or FakeConfig()})
+    server = FakeAnthropicServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+def serve_in_thread(host: str = "127.0.0.1", port: int = 0, config: FakeConfig = None) -> tuple:
+    # (server, base url) of a fake API running in a background thread, port 0 picks a free one
+    server = make_server(host, port, config)
+    threading.Thread(target=server.serve_forever, name="fake-anthropic", daemon=True).start()
+    return server, f"http://{server.server_address[0]}:{server.server_address[1]}"
+
+def add_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--fake-latency", help="Fake API: seconds before the first token", type=float, default=0.2)
+    parser.add_argument("--fake-input-token-latency", help="Fake API: extra seconds per input token", type=float, default=0.000005)
+    parser.add_argument("--fake-output-token-latency", help="Fake API: seconds per output token", type=float, default=0.005)
+    parser.add_argument("--fake-output-tokens", help="Fake API: tokens in each answer", type=int, default=200)
+    parser.add_argument("--fake-error-rate", help="Fake API: share of requests that fail", type=float, default=0.0)
+    parser.add_argument("--fake-error-status", help="Fake API: HTTP status of failed requests (429, 500 or 529)", type=int, default=529)
+    parser.add_argument("--fake-seed", help="Fake API: seed for which requests fail", type=int)
+
+def config_from_args(args) -> FakeConfig:
+    return FakeConfig(args.fake_latency, args.fake_input_token_latency, args.fake_output_token_latency,
+                      args.fake_output_tokens, args.fake_error_rate, args.fake_error_status, args.fake_seed)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("-p", "--port", type=int, default=8787)
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, config_from_args(args))
+    print(f"Fake Anthropic API on http://{args.host}:{server.server_address[1]}, "
+          f"run the bot with ANTHROPIC_API_URL=http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
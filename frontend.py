@@ -3,16 +3,23 @@ import os
 import re
 import sys
 import logging
+import time
+import uuid
 import datetime
 import streamlit as st 
 from dotenv import load_dotenv
-from backend import load_llm, generate_answer
+from backend import (load_llm, load_semantic_cache, resolve_graphs, stream_answer_async, iterate_async, token_usage,
+                     fast_path_stats, API_URL, CACHE_PATH, USAGE_PATH, METRICS_PORT)
+import metrics
+from cache import AnswerCache
+from usage import UsageLedger
+from tracing import RingBufferExporter, add_exporter, record, span, stage_summary
 
 
 
 # Prep data
 load_dotenv(".env")
-ANTHROPIC_KEY = os.environ["ANTHROPIC_API_KEY"]
+ANTHROPIC_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 
 logging.basicConfig( 
     level=logging.INFO, 
@@ -22,7 +29,44 @@ logging.basicConfig(
     # filename='chatbot_log.txt'
 )
 
-llm = load_llm(ANTHROPIC_KEY)
+# Built once per process and shared by every session and rerun
+@st.cache_resource
+def get_llm(key: str, api_url: str):
+    return load_llm(key, api_url)
+
+@st.cache_resource
+def get_cache(path: str):
+    return AnswerCache(path)
+
+@st.cache_resource
+def get_semantic_cache(path: str):
+    return load_semantic_cache(path)
+
+@st.cache_resource
+def get_ledger(path: str):
+    return UsageLedger(path)
+
+@st.cache_resource
+def get_metrics_server(port: int):
+    # Prometheus metrics of every session, when JUSTIN_METRICS_PORT is set
+    return metrics.serve(port)[0] if port else None
+
+@st.cache_resource
+def get_trace_buffer():
+    # The latest spans of every session, to log where each question's time went
+    return add_exporter(RingBufferExporter())
+
+llm = get_llm(ANTHROPIC_KEY, API_URL)
+cache = get_cache(CACHE_PATH)
+semantic_cache = get_semantic_cache(CACHE_PATH)
+ledger = get_ledger(USAGE_PATH)
+trace_buffer = get_trace_buffer()
+metrics_server = get_metrics_server(METRICS_PORT)
+
+# Each browser session's tokens and cost are counted under its own id
+if "session_id" not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex[:12]
+session_id = st.session_state.session_id
 
 
 
@@ -34,21 +78,46 @@ with st.sidebar:
     with st.form(key='user_input'):
         query = st.text_area("Your question", max_chars=1000,
                               placeholder="How do I change the tick size in a horizontal bar graph's categorical axis?")
-        graph = st.selectbox("The graph you're using", ['bar', 'line', 'map', 'pie'])
+        graph = st.selectbox("The graph you're using", ['auto', 'bar', 'line', 'map', 'pie', 'all'],
+                             help="'auto' picks the graph from your question, 'all' searches every graph")
         submit = st.form_submit_button("Search")
 
 
 
 # Respond to input
 if submit and query:
-    # Answer the question with the most related article
-    answer = generate_answer(query, graph, llm)
-
+    # Answer the question with the most related article, showing it as it's written
     st.write("## Justin's answer:")
-    st.write("> " + answer.content.replace("\n", "\n> "))
+    graphs = resolve_graphs(query, graph)
+    if graph in ('auto', 'all'):
+        st.caption(f"Answering from the {', '.join(graphs)} code")
+    placeholder = st.empty()
+
+    start = time.perf_counter()
+    first_token = None
+    answer = None
+    rendering = 0.0
+    with span("question", graph_type=graph) as question:
+        # The request itself runs on the backend's shared event loop, which limits how many are sent at once
+        for chunk in iterate_async(stream_answer_async(query, graph, llm, cache=cache, semantic_cache=semantic_cache,
+                                                          ledger=ledger, session=session_id)):
+            answer = chunk if answer is None else answer + chunk
+            if chunk.content and first_token is None:
+                first_token = time.perf_counter() - start
+            render_start = time.perf_counter()
+            placeholder.write("> " + answer.content.replace("\n", "\n> "))
+            rendering += time.perf_counter() - render_start
+        record("render", rendering, parent=question)
 
-    logging.info(f"Question: {query}\n")
+    logging.info(f"Question ({graph}): {query}\n")
+    logging.info(f"Graphs: {', '.join(graphs)}\n")
     logging.info(f"Answer: {answer.content}\n")
+    logging.info(f"Tokens: {token_usage(answer)}\n")
+    logging.info(f"Time to first token: {first_token or 0:.2f}s, total: {time.perf_counter() - start:.2f}s\n")
+    logging.info(f"Semantic cache: {semantic_cache.stats()}\n")
+    logging.info(f"Fast path: {fast_path_stats()}\n")
+    logging.info(f"Session {session_id} usage: {ledger.totals(session=session_id)}\n")
+    logging.info(f"Stages: {stage_summary(trace_buffer.spans(question.trace_id))}\n")
 
 # Error message
 elif submit and not query:
@@ -0,0 +1,187 @@
+"""METRICS.PY
+Counters, gauges and histograms of how the bot is doing (latency, time to first token,
+cache hits, errors, retries, questions in flight), served over HTTP in the Prometheus
+text format. Updating a metric only touches the calling thread's own shard, so the hot
+path takes no lock; the shards are added up when the metrics are read.
+"""
+
+# Load libraries
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+
+# Seconds, for latencies from a fast path answer (~1ms) to a long streamed one
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 40.0)
+
+class Shards:
+    # One dict per thread that only that thread writes to. Dicts of threads
+    # that ended are kept, so their counts aren't lost.
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards = []
+
+    def mine(self) -> dict:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = {}
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def all(self) -> list:
+        with self._lock:
+            return list(self._shards)
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.shards = Shards()
+
+    def _key(self, labels: dict) -> tuple:
+        if len(labels) != len(self.labels):
+            raise ValueError(f"{self.name} takes the labels {', '.join(self.labels) or 'none'}, not {', '.join(labels)}")
+        return tuple(str(labels[label]) for label in self.labels)
+
+    def _label_text(self, key: tuple, extra: str = "") -> str:
+        pairs = [f'{label}="{escape(value)}"' for label, value in zip(self.labels, key)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def values(self) -> dict:
+        # Label values -> total over every thread. Without labels it's 0 until it's updated.
+        totals = {} if self.labels else {(): 0}
+        for shard in self.shards.all():
+            for key, value in list(shard.items()):
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def samples(self) -> list:
+        return [(self.name + self._label_text(key), value) for key, value in sorted(self.values().items())]
+
+    def exposition(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(f"{name} {format_value(value)}" for name, value in self.samples())
+        return "\n".join(lines)
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels):
+        shard = self.shards.mine()
+        key = self._key(labels)
+        shard[key] = shard.get(key, 0) + amount
+
+class Gauge(Counter):
+    # Kept as each thread's ups and downs, so it can go up in one thread and down in another
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        # Each shard value is [count per bucket..., count above the last bucket, sum]
+        shard = self.shards.mine()
+        key = self._key(labels)
+        counts = shard.get(key)
+        if counts is None:
+            counts = shard[key] = [0] * (len(self.buckets) + 2)
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def values(self) -> dict:
+        totals = {}
+        for shard in self.shards.all():
+            for key, counts in list(shard.items()):
+                total = totals.setdefault(key, [0] * (len(self.buckets) + 2))
+                for i, count in enumerate(list(counts)):
+                    total[i] += count
+        return totals
+
+    def samples(self) -> list:
+        samples = []
+        for key, counts in sorted(self.values().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                samples.append((f"{self.name}_bucket" + self._label_text(key, f'le="{format_value(bound)}"'), cumulative))
+            samples.append((f"{self.name}_sum" + self._label_text(key), counts[-1]))
+            samples.append((f"{self.name}_count" + self._label_text(key), cumulative))
+        return samples
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def register(self, metric: Metric) -> Metric:
+        # The same name twice gives back the first metric, so modules can be reloaded
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help: str, labels: tuple = ()) -> Counter:
+        return self.register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: tuple = ()) -> Gauge:
+        return self.register(Gauge(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help, labels, buckets))
+
+    def exposition(self) -> str:
+        # Every metric in the Prometheus text format (version 0.0.4)
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(metric.exposition() + "\n" for metric in metrics)
+
+registry = Registry()
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    registry = registry
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        data = self.registry.exposition().encode()
+        self.send_response(200)
+        self.send_header("content-type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("content-length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+def serve(port: int, host: str = "127.0.0.1", metrics: Registry = registry) -> tuple:
+    # (server, url) of /metrics served from a background thread, port 0 picks a free one
+    handler = type("Handler", (MetricsHandler,), {"registry": metrics})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="justin-bot-metrics", daemon=True).start()
+    return server, f"http://{server.server_address[0]}:{server.server_address[1]}/metrics"
@@ -0,0 +1,208 @@
+"""PREPROCESS.PY
+Shrinks the Javascript source before it's indexed and sent to the model, since every
+comment, blank line and indent costs input tokens. The many near-identical chaining
+get/set methods can also be replaced by a compact table of the options they set.
+"""
+
+# Load libraries
+import re
+import textwrap
+from dataclasses import dataclass
+
+from chunking import Chunk
+
+
+
+LINE_COMMENT_RE = re.compile(r"^\s*//(.*)$")
+BANNER_RE = re.compile(r"^\s*//\s*(#region|#?endregion|=+)")
+LICENSE_RE = re.compile(r"copyright|permission to use|warrant", re.IGNORECASE)
+CODE_RE = re.compile(
+    r"[;{}()\[\],]\s*$"
+    r"|^\s*\."
+    r"|^\s*(if|else|for|while|return|const|let|var|function|this\.|that\.|d3\.|console\.|\$\()"
+)
+
+def _is_commented_code(comment: str) -> bool:
+    return bool(CODE_RE.search(comment))
+
+def _strip_comments(lines: list) -> list:
+    # Drops region banners, license blocks and runs of `//` lines that are mostly
+    # commented-out code. Prose comments and /* */ parameter docs are kept.
+    kept = []
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if BANNER_RE.match(line):
+            i += 1
+            continue
+
+        if line.strip().startswith("/*"):
+            end = next((j for j in range(i, len(lines)) if "*/" in lines[j]), len(lines) - 1)
+            block = lines[i:end + 1]
+            if not LICENSE_RE.search("\n".join(block)):
+                kept.extend(block)
+            i = end + 1
+            continue
+
+        if LINE_COMMENT_RE.match(line):
+            end = i
+            while end < len(lines) and LINE_COMMENT_RE.match(lines[end]) and not BANNER_RE.match(lines[end]):
+                end += 1
+            run = lines[i:end]
+            code = sum(_is_commented_code(LINE_COMMENT_RE.match(comment).group(1)) for comment in run)
+            if code * 2 < len(run):
+                kept.extend(run)
+            i = end
+            continue
+
+        kept.append(line)
+        i += 1
+    return kept
+
+def _collapse_indent(lines: list) -> list:
+    # One space per indentation level instead of two or four
+    widths = [len(line) - len(line.lstrip(" ")) for line in lines if line.strip()]
+    unit = min((width for width in widths if width), default=1)
+    return [" " * ((len(line) - len(line.lstrip(" "))) // unit) + line.lstrip(" ") for line in lines]
+
+def minify_js(source: str) -> str:
+    # Identifiers and code are left exactly as they are, only comments that
+    # don't help explain the code and whitespace are removed
+    lines = [line.rstrip() for line in textwrap.dedent(source).split("\n")]
+    lines = [line for line in _strip_comments(lines) if line.strip()]
+    return "\n".join(_collapse_indent(lines))
+
+
+# Chaining get/set methods
+
+@dataclass(frozen=True)
+class Accessor:
+    class_name: str
+    name: str
+    argument: str
+    field: str
+    default: str
+    type: str
+    validation: str
+    description: str
+    chunk: Chunk
+
+FIELD_RE = re.compile(r"^\s*#(\w+)\s*(?:=\s*(.*?))?;?\s*(?://.*)?$")
+SIGNATURE_RE = re.compile(r"^\s*(\w+)\((\w+)\)\s*\{")
+TYPE_RE = re.compile(r"\(type:\s*([^)]+)\)")
+DESCRIPTION_RE = re.compile(r"^\s*-\s+(.+?)\s*$", re.MULTILINE)
+ERROR_RE = re.compile(r"console\.error\(\s*((?:(['\"`]).*?\2\s*\+?\s*)+)\)", re.DOTALL)
+STRING_RE = re.compile(r"(['\"`])(.*?)\1", re.DOTALL)
+LOCAL_RE = r"\b(?:let|const|var)\s+{}\s*=\s*(.+?);?\s*$"
+
+def error_message(text: str):
+    # The message a method logs for an invalid argument, with its string pieces joined
+    # and `${name}` filled in from the local `let name = ...`, or None. Options checked
+    # against a local `accepted` list that the message doesn't name are added to it.
+    error = ERROR_RE.search(text)
+    if not error:
+        return None
+    message = "".join(piece for quote, piece in STRING_RE.findall(error.group(1)))
+
+    def local(name):
+        declared = re.search(LOCAL_RE.format(re.escape(name)), text, re.MULTILINE)
+        return declared.group(1) if declared else None
+
+    message = re.sub(r"\$\{(\w+)\}", lambda match: local(match.group(1)) or match.group(0), message)
+    accepted = local("accepted")
+    options = re.findall(r"['\"]([^'\"]+)['\"]", accepted or "")
+    if not all(re.search(rf"\b{re.escape(option)}\b", message) for option in options):
+        message += f" (accepted = {accepted})"
+    return message
+
+def full_value(lines: list, start: int) -> tuple:
+    # (value, last line index) of the `= value` starting on lines[start], which
+    # for an array or object may run over several lines
+    text = ""
+    for i in range(start, len(lines)):
+        text += " " + lines[i].strip()
+        if text.count("[") + text.count("{") <= text.count("]") + text.count("}"):
+            break
+    return text.split("=", 1)[1].strip().rstrip(";"), i
+
+def field_declarations(chunk: Chunk) -> list:
+    # (first line, last line, field, initial value) of every `#field = value;` in a chunk between methods
+    declarations = []
+    if chunk.kind != "source" or chunk.name:
+        return declarations
+    lines = chunk.text.split("\n")
+    for offset, line in enumerate(lines):
+        declaration = FIELD_RE.match(line)
+        if declaration:
+            value, last = declaration.group(2) or "undefined", offset
+            if value.endswith(("[", "{")):
+                value, last = full_value(lines, offset)
+            declarations.append((chunk.start_line + offset, chunk.start_line + last, declaration.group(1), value))
+    return declarations
+
+def field_defaults(chunks: list) -> dict:
+    # (class name, field) -> the initial value of every field declared between methods
+    return {(chunk.class_name, field): value
+            for chunk in chunks for line, last, field, value in field_declarations(chunk)}
+
+def parse_accessor(chunk: Chunk, defaults: dict):
+    # An Accessor if the chunk is a public `name(input)` method that only gets or
+    # validates and sets one field to its argument, else None
+    if chunk.kind != "source" or not chunk.name or chunk.name.startswith("#") or "(part" in chunk.title:
+        return None
+    signature = SIGNATURE_RE.match(chunk.text)
+    if not signature or "arguments.length === 0" not in chunk.text or "return this" not in chunk.text:
+        return None
+    argument = signature.group(2)
+    assignments = set(re.findall(r"this\.#(\w+)\s*=\s*([^=;\n][^;\n]*?);?\s*$", chunk.text, re.MULTILINE))
+    if len(assignments) != 1 or re.search(r"this\.#?\w+\(|d3\.", chunk.text):
+        return None
+    field, value = assignments.pop()
+    if value.strip() != argument:
+        return None
+
+    comment = re.search(r"/\*(.*?)\*/", chunk.text, re.DOTALL)
+    comment = comment.group(1) if comment else ""
+    type_match = TYPE_RE.search(comment)
+    error = error_message(chunk.text)
+    description = " ".join(DESCRIPTION_RE.findall(comment))
+    return Accessor(chunk.class_name, chunk.name, argument, field,
+                    defaults.get((chunk.class_name, field), "undefined"),
+                    type_match.group(1).strip() if type_match else "any",
+                    error or "none",
+                    description,
+                    chunk)
+
+def collapse_accessors(chunks: list, rows_per_table: int = 12) -> list:
+    # Replaces the get/set methods with tables of one row per method. Each table
+    # takes the place of the first method in it, so the rest keep their order.
+    defaults = field_defaults(chunks)
+    accessors = {}
+    for chunk in chunks:
+        accessor = parse_accessor(chunk, defaults)
+        if accessor:
+            accessors[chunk] = accessor
+
+    groups = []
+    for chunk in chunks:
+        if chunk in accessors:
+            if not groups or len(groups[-1]) == rows_per_table or groups[-1][-1].class_name != chunk.class_name:
+                groups.append([])
+            groups[-1].append(accessors[chunk])
+    tables = {group[0].chunk: group for group in groups}
+
+    collapsed = []
+    for chunk in chunks:
+        if chunk in tables:
+            group = tables[chunk]
+            rows = [f"{a.name}({a.argument}) | #{a.field} = {a.default} | {a.type} | {a.validation} | {a.description}"
+                    for a in group]
+            text = "\n".join([f"// {chunk.class_name} chaining methods: call with no argument to get the field, "
+                              "with one to validate and set it, returns this",
+                              "// method | field = default | argument type | error if invalid | description"] + rows)
+            collapsed.append(Chunk(chunk.graph_type, "source", f"{chunk.class_name} chaining methods ({group[0].name} to {group[-1].name})",
+                                   text, group[0].chunk.start_line, group[-1].chunk.end_line,
+                                   chunk.class_name, "", "", chunk.region))
+        elif chunk not in accessors:
+            collapsed.append(chunk)
+    return collapsed
@@ -0,0 +1,220 @@
+"""RETRIEVAL.PY
+Picks the chunks of source code and documentation that are relevant to a question,
+so only those are sent to the model instead of the whole file
+"""
+
+# Load libraries
+import re
+import math
+import heapq
+from collections import Counter
+from dataclasses import dataclass, replace
+
+from chunking import Chunk, chunk_source, chunk_documentation
+from preprocess import minify_js, collapse_accessors
+
+
+
+WORD_RE = re.compile(r"[A-Za-z0-9_$]+")
+PART_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "does", "for", "how", "i", "if",
+    "in", "is", "it", "my", "of", "on", "or", "so", "that", "the", "this", "to", "what", "when",
+    "where", "which", "with", "you", "your",
+}
+
+def _normalize(word: str) -> str:
+    # Crude plural stripping so 'bars' matches 'bar' and 'ticks' matches 'tick'
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "is", "us")):
+        return word[:-1]
+    return word
+
+def tokenize(text: str) -> list:
+    # Identifiers are kept whole and also split on camelCase/snake_case,
+    # so `legendCircleSpacing` matches "legend circle spacing" and vice versa
+    tokens = []
+    for word in WORD_RE.findall(text):
+        parts = PART_RE.findall(word)
+        whole = word.lower().strip("_$")
+        if whole and whole not in STOP_WORDS:
+            tokens.append(_normalize(whole))
+        if len(parts) > 1:
+            tokens.extend(_normalize(part.lower()) for part in parts if part.lower() not in STOP_WORDS)
+    return tokens
+
+def estimate_tokens(text: str) -> int:
+    # Claude's tokenizer averages about 4 characters per token on this code and markdown
+    return math.ceil(len(text) / 4)
+
+
+# Index
+
+class ContextIndex:
+    # BM25 over an inverted index. The BM25 weight of every (term, chunk) pair
+    # doesn't depend on the question, so it's computed once here and a search
+    # only adds up the postings of the question's terms.
+    def __init__(self, chunks: list, k1: float = 1.2, b: float = 0.75):
+        self.chunks = chunks
+        self.postings = {}
+
+        counts = [Counter(tokenize(chunk.text)) for chunk in chunks]
+        lengths = [sum(terms.values()) for terms in counts]
+        average_length = sum(lengths) / max(len(lengths), 1)
+
+        document_frequency = Counter()
+        for terms in counts:
+            document_frequency.update(terms.keys())
+        self.document_frequency = document_frequency
+
+        for doc_id, terms in enumerate(counts):
+            norm = k1 * (1 - b + b * lengths[doc_id] / average_length)
+            for term, frequency in terms.items():
+                df = document_frequency[term]
+                idf = math.log(1 + (len(chunks) - df + 0.5) / (df + 0.5))
+                self.postings.setdefault(term, []).append((doc_id, idf * frequency * (k1 + 1) / (frequency + norm)))
+
+    @classmethod
+    def from_corpus(cls, graph_type: str, source: str, documentation: str, minify: bool = False,
+                    collapse: bool = False) -> "ContextIndex":
+        source_chunks = chunk_source(graph_type, source)
+        if collapse:
+            source_chunks = collapse_accessors(source_chunks)
+        if minify:
+            # Line spans still point at the original source
+            source_chunks = [replace(chunk, text=minify_js(chunk.text)) for chunk in source_chunks]
+            source_chunks = [chunk for chunk in source_chunks if chunk.text]
+        return cls(source_chunks + chunk_documentation(graph_type, documentation))
+
+    def scores(self, query: str) -> dict:
+        # BM25 score of every chunk that shares a term with the query, by chunk position
+        scores = {}
+        for term in set(tokenize(query)):
+            for doc_id, weight in self.postings.get(term, ()):
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight
+        return scores
+
+    def search(self, query: str, top_k: int, graph_types=None, exclude=None) -> list:
+        # (score, chunk) pairs, best first, optionally only from some graph types
+        # and leaving out the chunks `exclude` is true for
+        scores = self.scores(query).items()
+        if graph_types is not None:
+            scores = [(doc_id, score) for doc_id, score in scores if self.chunks[doc_id].graph_type in graph_types]
+        if exclude is not None:
+            scores = [(doc_id, score) for doc_id, score in scores if not exclude(self.chunks[doc_id])]
+        best = heapq.nlargest(top_k, scores, key=lambda item: item[1])
+        return [(score, self.chunks[doc_id]) for doc_id, score in best]
+
+
+# Routing
+
+class Router:
+    # Picks which graph types a question is about. Each graph type is one
+    # document made of its class name, method names and documentation headings,
+    # so the search is a handful of postings and takes microseconds.
+    def __init__(self, profiles: dict):
+        self.graph_types = list(profiles)
+        self.index = ContextIndex([Chunk(graph_type, "profile", graph_type, text, 0, 0)
+                                   for graph_type, text in profiles.items()], b=0.3)
+
+    @classmethod
+    def from_indexes(cls, indexes: dict, keywords: dict) -> "Router":
+        profiles = {}
+        for graph_type, index in indexes.items():
+            names = {chunk.class_name for chunk in index.chunks if chunk.class_name}
+            names.update(chunk.name for chunk in index.chunks if chunk.name and not chunk.name.startswith("#"))
+            names.update(chunk.title for chunk in index.chunks if chunk.kind == "documentation")
+            profiles[graph_type] = " ".join([keywords.get(graph_type, graph_type)] + sorted(names))
+        return cls(profiles)
+
+    def route(self, query: str, ratio: float = 0.5) -> list:
+        # Graph types scoring at least `ratio` of the best one, best first. A
+        # question that matches none of them could be about any.
+        scores = self.index.scores(query)
+        if not scores:
+            return list(self.graph_types)
+        best = max(scores.values())
+        ranked = sorted(scores.items(), key=lambda item: -item[1])
+        return [self.graph_types[doc_id] for doc_id, score in ranked if score >= ratio * best]
+
+
+# Context
+
+@dataclass
+class Packing:
+    selected: list
+    dropped: list  # ranked and related chunks that didn't fit the budget
+    tokens: int
+    budget: int
+
+def format_chunk(chunk, label: bool = False) -> str:
+    # With label, documentation says which graph's file it's from, for contexts mixing graphs
+    if chunk.kind == "source":
+        return f"// {chunk.title} (lines {chunk.start_line}-{chunk.end_line})\n{chunk.text}"
+    if label:
+        return f"<!-- {chunk.graph_type}.md -->\n{chunk.text}"
+    return chunk.text
+
+def pack_chunks(ranked: list, budget: int) -> Packing:
+    # Greedily takes chunks in rank order while they fit the budget. A chunk that
+    # doesn't fit is dropped, but smaller ones after it can still fill the space.
+    selected = []
+    dropped = []
+    used = 0
+    for chunk in ranked:
+        # +1 for the blank line between chunks, the label is counted in case the context mixes graphs
+        tokens = estimate_tokens(format_chunk(chunk, label=True)) + 1
+        if used + tokens > budget:
+            dropped.append(chunk)
+            continue
+        selected.append(chunk)
+        used += tokens
+    return Packing(selected, dropped, used, budget)
+
+@dataclass
+class Context:
+    source: str
+    documentation: str
+    chunks: list
+    tokens: int
+    dropped: list
+
+def assemble_context(packing: Packing) -> Context:
+    # Keep the order of the original files so the model reads them as written
+    selected = sorted(packing.selected, key=lambda chunk: (chunk.kind, chunk.graph_type, chunk.start_line))
+    label = len({chunk.graph_type for chunk in selected}) > 1
+    source = "\n\n".join(format_chunk(chunk, label) for chunk in selected if chunk.kind == "source")
+    documentation = "\n\n".join(format_chunk(chunk, label) for chunk in selected if chunk.kind == "documentation")
+    return Context(source, documentation, selected, packing.tokens, packing.dropped)
+
+def is_reference(chunk) -> bool:
+    # Chunks that don't depend on the question: documentation and the source between
+    # methods (file header, fields, chaining method tables). They're sent whole with
+    # every question as the cacheable reference, so retrieval only picks methods.
+    return chunk.kind == "documentation" or (chunk.kind == "source" and not chunk.name)
+
+def retrieve_context(index: ContextIndex, query: str, max_tokens: int, top_k: int = 30, graph_types=None,
+                     pinned: list = (), expand=None, expand_share: float = 0.25, exclude=None) -> Context:
+    # Pinned chunks, like the definitions of symbols the question names, go before the ranked ones.
+    # Chunks `exclude` is true for are never picked.
+    if exclude is not None:
+        pinned = [chunk for chunk in pinned if not exclude(chunk)]
+    ranked = list(pinned) + [chunk for score, chunk in index.search(query, top_k, graph_types, exclude)
+                             if chunk not in pinned]
+    if expand is None:
+        return assemble_context(pack_chunks(ranked, max_tokens))
+
+    # `expand` gives the chunks related to a selected one, like the methods it
+    # calls and is called by. They get what the ranked chunks leave of the
+    # budget, at least expand_share of it, and ranked chunks that didn't fit
+    # can still use what they leave. Whatever's left out of both is dropped.
+    packing = pack_chunks(ranked, int(max_tokens * (1 - expand_share)))
+    related = []
+    for chunk in packing.selected:
+        related.extend(other for other in expand(chunk)
+                       if other not in packing.selected and other not in related
+                       and (graph_types is None or other.graph_type in graph_types)
+                       and (exclude is None or not exclude(other)))
+    extra = pack_chunks(related + [chunk for chunk in packing.dropped if chunk not in related],
+                        max_tokens - packing.tokens)
+    return assemble_context(Packing(packing.selected + extra.selected, extra.dropped,
+                                    packing.tokens + extra.tokens, max_tokens))
@@ -0,0 +1,335 @@
+"""SYMBOLS.PY
+A table of every method, #field and CSS selector in the graph classes, pointing to
+where each is defined, so a question that names one gets its definition and simple
+lookups like "what's the default of X" don't need the model
+"""
+
+# Load libraries
+import re
+from dataclasses import dataclass
+
+from chunking import HEADING_RE, chunk_source
+from preprocess import TYPE_RE, DESCRIPTION_RE, error_message, field_declarations, parse_accessor
+
+
+
+@dataclass(frozen=True)
+class Symbol:
+    graph_type: str
+    kind: str  # 'method', 'field' or 'selector'
+    name: str  # '#' kept for private methods and fields
+    class_name: str
+    path: str  # 'bar.js', 'bar.md', ...
+    start_line: int  # 1-based, inclusive
+    end_line: int
+    signature: str = ""
+    field: str = ""  # the field a chaining method gets and sets
+    default: str = ""
+    type: str = ""
+    validation: str = ""
+    description: str = ""
+
+    @property
+    def key(self) -> str:
+        return symbol_key(self.name)
+
+def symbol_key(name: str) -> str:
+    # `legendPosition`, `#legendPosition` and `legendposition()` are looked up the same way
+    return name.strip().strip("`").removesuffix("()").lstrip("#").lower()
+
+
+# Source code
+
+GETTER_RE = re.compile(r"arguments\.length\s*===?\s*0\s*\)\s*\{?\s*return\s+this\.#(\w+)")
+
+def _method_symbol(chunk, end_line: int, defaults: dict) -> Symbol:
+    accessor = parse_accessor(chunk, defaults)
+    if accessor:
+        return Symbol(chunk.graph_type, "method", chunk.name, chunk.class_name, f"{chunk.graph_type}.js",
+                      chunk.start_line, end_line, chunk.signature, accessor.field, defaults.get((chunk.class_name, accessor.field), ""),
+                      accessor.type, "" if accessor.validation == "none" else accessor.validation, accessor.description)
+
+    # Methods that validate more than one thing still document their argument the same way
+    comment = re.search(r"/\*(.*?)\*/", chunk.text, re.DOTALL)
+    comment = comment.group(1) if comment else ""
+    type_match = TYPE_RE.search(comment)
+    error = error_message(chunk.text)
+    getter = GETTER_RE.search(chunk.text)
+    field = getter.group(1) if getter else ""
+    return Symbol(chunk.graph_type, "method", chunk.name, chunk.class_name, f"{chunk.graph_type}.js",
+                  chunk.start_line, end_line, chunk.signature, field,
+                  defaults.get((chunk.class_name, field), "") if field else "",
+                  type_match.group(1).strip() if type_match else "",
+                  error or "",
+                  " ".join(DESCRIPTION_RE.findall(comment)))
+
+def source_symbols(graph_type: str, source: str) -> list:
+    chunks = chunk_source(graph_type, source)
+    fields = []
+    for chunk in chunks:
+        for line, end, field, value in field_declarations(chunk):
+            fields.append(Symbol(graph_type, "field", f"#{field}", chunk.class_name, f"{graph_type}.js",
+                                 line, end, default=value))
+    defaults = {(field.class_name, field.name[1:]): field.default for field in fields}
+
+    symbols = []
+    for i, chunk in enumerate(chunks):
+        if chunk.name and "(part" not in chunk.title:
+            # A long method is split into parts, its span runs to the end of the last one
+            end_line = chunk.end_line
+            for part in chunks[i + 1:]:
+                if part.title.startswith(chunk.title + " (part"):
+                    end_line = part.end_line
+            symbols.append(_method_symbol(chunk, end_line, defaults))
+    return symbols + fields
+
+
+# Documentation
+
+SELECTOR_RE = re.compile(r"`([^`]*[#.>][^`]*)`")
+BULLET_RE = re.compile(r"^\s*-\s*\*([^*]+)\*")
+
+def _is_selector(text: str) -> bool:
+    # `svg#bar1 g.bars` or `text.graph-title`, but not `Bar.vertical(true)` or a file path
+    return bool(re.fullmatch(r"[\w\-]*[#.][\w\-]+(\s*>?\s*[\w\-]*([#.][\w\-]+)?)*", text)) and "/" not in text
+
+def selector_symbols(graph_type: str, documentation: str) -> list:
+    # Selectors quoted in the "## CSS" section, described by the bullet they're under
+    symbols = []
+    in_css = False
+    label = ""
+    for number, line in enumerate(documentation.split("\n"), 1):
+        if HEADING_RE.match(line):
+            in_css = line.strip("# ").strip().upper() == "CSS"
+            continue
+        if not in_css:
+            continue
+        bullet = BULLET_RE.match(line)
+        if bullet:
+            label = bullet.group(1).strip()
+        text = BULLET_RE.sub("", line).strip(" :")
+        for selector in SELECTOR_RE.findall(line):
+            if _is_selector(selector):
+                symbols.append(Symbol(graph_type, "selector", selector, "", f"{graph_type}.md", number, number,
+                                      description=f"{label}: {text}" if label else text))
+    return symbols
+
+
+# Lookups
+
+IDENTIFIER_RE = re.compile(r"(#?)([A-Za-z_$][\w$]*)(\s*\()?")
+BACKTICK_RE = re.compile(r"`([^`]+)`")
+
+class SymbolTable:
+    def __init__(self, symbols: list):
+        self.symbols = symbols
+        self.names = {}
+        for symbol in symbols:
+            self.names.setdefault(symbol.key, []).append(symbol)
+        self.selectors = sorted({symbol.name for symbol in symbols if symbol.kind == "selector"}, key=len, reverse=True)
+
+    @classmethod
+    def from_corpora(cls, corpora: dict) -> "SymbolTable":
+        # corpora is graph type -> (source, documentation)
+        symbols = []
+        for graph_type, (source, documentation) in corpora.items():
+            symbols.extend(source_symbols(graph_type, source))
+            symbols.extend(selector_symbols(graph_type, documentation))
+        return cls(symbols)
+
+    def lookup(self, name: str, graph_types=None) -> list:
+        # Every symbol with the name, in any graph type unless given
+        return [symbol for symbol in self.names.get(symbol_key(name), ())
+                if graph_types is None or symbol.graph_type in graph_types]
+
+    def named_in(self, query: str, graph_types=None) -> list:
+        # Symbols the question names. Plain words like 'data' or 'title' are also
+        # method names, so only names that look like code count: in backticks,
+        # camelCase, snake_case, #private or called like `name(`.
+        names = []
+        for quoted in BACKTICK_RE.findall(query):
+            names.append(quoted.split("(")[0].split(".")[-1] if not _is_selector(quoted) else quoted)
+        for private, word, call in IDENTIFIER_RE.findall(query):
+            if private or call or "_" in word or re.search(r"[a-z][A-Z]", word):
+                names.append(word)
+        names.extend(selector for selector in self.selectors if selector in query)
+
+        found = []
+        for name in names:
+            for symbol in self.lookup(name, graph_types):
+                if symbol not in found:
+                    found.append(symbol)
+        return found
+
+def symbol_chunks(symbols: list, index) -> list:
+    # The chunk of the index each symbol is defined in, in the symbols' order.
+    # Chaining methods can be collapsed into a table, so the smallest chunk
+    # whose span holds the definition is used.
+    chunks = []
+    for symbol in symbols:
+        kind = "documentation" if symbol.path.endswith(".md") else "source"
+        spans = [chunk for chunk in index.chunks if chunk.graph_type == symbol.graph_type and chunk.kind == kind
+                 and chunk.start_line <= symbol.start_line <= chunk.end_line]
+        if spans:
+            chunk = min(spans, key=lambda chunk: chunk.end_line - chunk.start_line)
+            if chunk not in chunks:
+                chunks.append(chunk)
+    return chunks
+
+# Calls
+
+CALL_RE = re.compile(r"\b(?:this|that)\.(#?[A-Za-z_$][\w$]*)\s*\(")
+
+class CallGraph:
+    # Which methods of its own class each method calls, from the `this.method()`
+    # and `this.#method()` calls in its body (`that` is `this` inside callbacks)
+    def __init__(self, calls: dict):
+        self.callees = calls  # (graph type, method name) -> names of the methods it calls, in order
+        self.callers = {}
+        for (graph_type, name), callees in calls.items():
+            for callee in callees:
+                self.callers.setdefault((graph_type, callee), []).append(name)
+
+    @classmethod
+    def from_corpora(cls, corpora: dict) -> "CallGraph":
+        calls = {}
+        for graph_type, (source, documentation) in corpora.items():
+            bodies = {}
+            for chunk in chunk_source(graph_type, source):
+                if chunk.name:
+                    bodies[chunk.name] = bodies.get(chunk.name, "") + "\n" + chunk.text
+            for name, body in bodies.items():
+                callees = []
+                for callee in CALL_RE.findall(body):
+                    if callee != name and callee in bodies and callee not in callees:
+                        callees.append(callee)
+                calls[(graph_type, name)] = callees
+        return cls(calls)
+
+    def neighbours(self, graph_type: str, name: str) -> list:
+        # The methods a method calls, then the ones that call it
+        callees = self.callees.get((graph_type, name), [])
+        return callees + [caller for caller in self.callers.get((graph_type, name), []) if caller not in callees]
+
+
+def describe(symbol: Symbol) -> str:
+    # One line about a symbol, for the CLI and quick answers
+    where = f"{symbol.path}:{symbol.start_line}" + (f"-{symbol.end_line}" if symbol.end_line != symbol.start_line else "")
+    if symbol.kind == "selector":
+        return f"{where} CSS selector `{symbol.name}` - {symbol.description}"
+    if symbol.kind == "field":
+        return f"{where} {symbol.class_name} field {symbol.name} = {symbol.default}"
+    details = [f"{where} {symbol.class_name}.{symbol.signature}"]
+    if symbol.field:
+        details.append(f"sets #{symbol.field} (default {symbol.default})")
+    if symbol.type:
+        details.append(f"argument type: {symbol.type}")
+    if symbol.validation:
+        details.append(f"error if invalid: {symbol.validation}")
+    if symbol.description:
+        details.append(symbol.description)
+    return " | ".join(details)
+
+
+
+# Quick answers
+
+# Words that only say what's asked about a symbol, a question made of these and
+# one symbol name is a lookup
+LOOKUP_WORDS = {
+    "what", "whats", "s", "is", "are", "does", "do", "the", "a", "an", "default", "defaults", "value", "values",
+    "initial", "of", "for", "method", "function", "field", "option", "setting", "parameter", "argument", "mean",
+    "means", "set", "sets", "it", "its", "explain", "describe", "tell", "me", "about", "purpose", "type", "in",
+    "this", "class", "graph", "chart", "selector", "css", "used", "bar", "line", "map", "pie", "bargraph",
+    "linegraph", "piechart",
+}
+LOOKUP_INTENT = {"what", "whats", "default", "defaults", "explain", "describe", "mean", "means", "purpose"}
+WORD_RE = re.compile(r"#?[A-Za-z_$][\w$]*")
+
+def lookup_name(table: SymbolTable, query: str):
+    # The one symbol a lookup question like "what's the default of legendPosition?"
+    # is about, or None if the question asks for more than a lookup
+    selector = next((selector for selector in table.selectors if selector in query), None)
+    if selector:
+        query = query.replace(selector, " ")
+    words = [word for word in WORD_RE.findall(query.replace("`", " ").replace("()", " "))]
+    if not LOOKUP_INTENT & {word.lower() for word in words}:
+        return None
+    names = [word for word in words if word.lower() not in LOOKUP_WORDS]
+    if selector:
+        return selector if not names else None
+    return names[0] if len(names) == 1 else None
+
+def _mentions(documentation: str, name: str, limit: int = 2) -> list:
+    pattern = re.compile(r"(?<![\w#])" + re.escape(name.lstrip("#")) + r"\b")
+    return [line.strip().lstrip("-* ").strip() for line in documentation.split("\n") if pattern.search(line)][:limit]
+
+def _quick_method(symbol: Symbol, documentation: str):
+    if not (symbol.description or symbol.field or symbol.type):
+        return None  # nothing but its code to go on, the model has to read it
+    lines = [f"**{symbol.class_name}.{symbol.signature}** ({symbol.path}, lines {symbol.start_line}-{symbol.end_line})"]
+    if symbol.description:
+        lines.append(symbol.description)
+    if symbol.field:
+        lines.append(f"- Call it with no argument to get `#{symbol.field}`, or with one to set it and chain the next call")
+        lines.append(f"- Default: `{symbol.default or 'undefined'}`")
+    if symbol.type:
+        lines.append(f"- Argument type: {symbol.type}")
+    if symbol.validation:
+        lines.append(f"- An invalid argument logs: \"{symbol.validation}\"")
+    lines.extend(f"> {line}" for line in _mentions(documentation, symbol.name))
+    return "\n".join(lines)
+
+def quick_answer(table: SymbolTable, query: str, graph_types, documentation: dict):
+    # An answer made from the symbol table for a question that only looks up one
+    # method, field or CSS selector, or None when it's not confident enough and
+    # the model should answer. documentation is graph type -> markdown.
+    name = lookup_name(table, query)
+    symbols = table.lookup(name, graph_types) if name else []
+    if not symbols:
+        return None
+
+    answers = []
+    for graph_type in graph_types:
+        found = [symbol for symbol in symbols if symbol.graph_type == graph_type]
+        methods = [symbol for symbol in found if symbol.kind == "method"]
+        covered = {symbol.field for symbol in methods}
+        for symbol in found:
+            if symbol.kind == "method":
+                answer = _quick_method(symbol, documentation.get(graph_type, ""))
+            elif symbol.kind == "field" and symbol.name[1:] not in covered:
+                answer = (f"**{symbol.class_name} field `{symbol.name}`** ({symbol.path}, lines {symbol.start_line}-{symbol.end_line})\n"
+                          f"- Default: `{symbol.default}`")
+            elif symbol.kind == "selector":
+                answer = f"**`{symbol.name}`** ({symbol.path}, line {symbol.start_line})\n{symbol.description}"
+            else:
+                continue
+            if answer is None:
+                return None
+            answers.append(answer)
+    return "\n\n".join(answers) or None
+
+
+if __name__ == "__main__":
+    import json
+    import time
+    import argparse
+    from dataclasses import asdict
+    from backend import load_symbols
+
+    parser = argparse.ArgumentParser(description="Looks up methods, #fields and CSS selectors of the graph classes")
+    parser.add_argument("names", help="Symbol names, e.g. legendPosition or '#colourSeries'", nargs="+")
+    parser.add_argument("-g", "--graph", help="Only look in one graph type", type=str)
+    parser.add_argument("--json", help="Print each symbol as JSON", action="store_true")
+    args = parser.parse_args()
+
+    table = load_symbols()
+    for name in args.names:
+        start = time.perf_counter()
+        symbols = table.lookup(name, (args.graph,) if args.graph else None)
+        elapsed = time.perf_counter() - start
+        if not symbols:
+            print(f"{name}: not found")
+        for symbol in symbols:
+            print(json.dumps(asdict(symbol)) if args.json else describe(symbol))
+        print(f"({len(symbols)} found in {elapsed * 1e6:.0f} µs)")
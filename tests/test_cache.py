@@ -0,0 +1,40 @@
+"""TEST_CACHE.PY
+Exact and semantic answer caches, and questions the semantic cache must keep apart.
+"""
+
+# Load libraries
+from backend import SEMANTIC_THRESHOLD, question_vectorizer
+from cache import AnswerCache, SemanticCache, cache_key, confusable_matches, normalize_question
+
+
+
+def test_no_confusable_pair_shares_an_answer():
+    assert confusable_matches(question_vectorizer(), SEMANTIC_THRESHOLD) == []
+
+def test_normalize_question_ignores_case_spacing_and_punctuation():
+    assert normalize_question("  How do I set  the WIDTH?! ") == "how do i set the width"
+
+def test_answer_cache_evicts_the_least_recently_used(tmp_path):
+    cache = AnswerCache(str(tmp_path / "cache.db"), max_entries=2)
+    cache.put(cache_key("first", "scope"), "1")
+    cache.put(cache_key("second", "scope"), "2")
+    assert cache.get(cache_key("First?", "scope")) == "1"
+    cache.put(cache_key("third", "scope"), "3")
+    assert [cache.get(cache_key(query, "scope")) for query in ("first", "second", "third")] == ["1", None, "3"]
+
+def test_semantic_cache_matches_paraphrases_within_a_scope(tmp_path):
+    cache = SemanticCache(str(tmp_path / "cache.db"), question_vectorizer(), SEMANTIC_THRESHOLD)
+    cache.put("How do I set the bar color?", "bar", "barColor()")
+    assert cache.get("how can I set the color of the bars", "bar") == "barColor()"
+    assert cache.get("how do I hide the legend", "bar") is None
+    assert cache.get("how do I set the bar color", "line") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+
+def test_semantic_cache_keeps_at_most_max_entries_per_scope(tmp_path):
+    cache = SemanticCache(str(tmp_path / "cache.db"), question_vectorizer(), SEMANTIC_THRESHOLD, max_entries=2)
+    for question in ("How do I hide the legend?", "How do I set the bar color?", "How do I change the width?"):
+        cache.put(question, "bar", question)
+    assert cache.get("How do I hide the legend?", "bar") is None
+    assert cache.get("How do I change the width?", "bar") == "How do I change the width?"
+    assert len(cache._entries["bar"]) == 2
+    assert cache._connection().execute("SELECT COUNT(*) FROM questions").fetchone()[0] == 2
@@ -0,0 +1,24 @@
+"""TEST_CASSETTE.PY
+Recorded requests are found again whatever host, headers or JSON key order they're sent with.
+"""
+
+# Load libraries
+import httpx
+
+from cassette import request_key
+
+
+
+def test_request_key_ignores_host_headers_and_key_order():
+    one = httpx.Request("POST", "https://api.anthropic.com/v1/messages", headers={"x-api-key": "a"},
+                        content=b'{"model": "m", "max_tokens": 10}')
+    other = httpx.Request("POST", "http://127.0.0.1:8080/v1/messages", headers={"x-api-key": "b"},
+                          content=b'{"max_tokens":10,"model":"m"}')
+    assert request_key(one) == request_key(other)
+
+def test_request_key_changes_with_the_body_or_path():
+    request = httpx.Request("POST", "http://localhost/v1/messages", content=b'{"model": "m"}')
+    assert request_key(request) != request_key(httpx.Request("POST", "http://localhost/v1/messages",
+                                                             content=b'{"model": "n"}'))
+    assert request_key(request) != request_key(httpx.Request("POST", "http://localhost/v1/complete",
+                                                             content=b'{"model": "m"}'))
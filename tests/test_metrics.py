@@ -0,0 +1,39 @@
+"""TEST_METRICS.PY
+Metrics updated from several threads add up, and come out in the Prometheus text format.
+"""
+
+# Load libraries
+import threading
+
+from metrics import Registry
+
+
+
+def test_counter_adds_up_every_thread():
+    registry = Registry()
+    requests = registry.counter("requests_total", "Questions answered", ("mode",))
+    threads = [threading.Thread(target=lambda: [requests.inc(mode="stream") for _ in range(1000)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert requests.values() == {("stream",): 4000}
+
+def test_exposition_format():
+    registry = Registry()
+    registry.gauge("in_flight", "Questions being answered").inc()
+    latency = registry.histogram("latency_seconds", "Time to answer", ("mode",), buckets=(0.1, 1.0))
+    latency.observe(0.05, mode="generate")
+    latency.observe(2.5, mode="generate")
+    assert registry.exposition() == "\n".join([
+        "# HELP in_flight Questions being answered",
+        "# TYPE in_flight gauge",
+        "in_flight 1",
+        "# HELP latency_seconds Time to answer",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{mode="generate",le="0.1"} 1',
+        'latency_seconds_bucket{mode="generate",le="1"} 1',
+        'latency_seconds_bucket{mode="generate",le="+Inf"} 2',
+        'latency_seconds_sum{mode="generate"} 2.55',
+        'latency_seconds_count{mode="generate"} 2',
+    ]) + "\n"
@@ -0,0 +1,80 @@
+"""TEST_PREPROCESS.PY
+Collapsing a class's chaining get/set methods into tables.
+"""
+
+# Load libraries
+from chunking import chunk_source
+from preprocess import collapse_accessors, error_message
+
+
+
+TINY_GRAPH = """class TinyGraph {
+  #width = 720;
+  #colors = [
+    'red',
+    'blue'
+  ];
+
+  width(inputWidth) {
+    /*
+    Parameters
+    ----------------
+    inputWidth (type: number)
+      - A non-negative number for the width of the graph.
+    */
+    if (arguments.length === 0) {
+      return this.#width;
+    }
+    else {
+      if (inputWidth >= 0) {
+        this.#width = inputWidth;
+        return this;
+      }
+      else {
+        console.error('width must be a non-negative number');
+      }
+    }
+  }
+
+  colors(inputColors) {
+    if (arguments.length === 0) {
+      return this.#colors;
+    }
+    else {
+      this.#colors = inputColors;
+      return this;
+    }
+  }
+
+  render() {
+    d3.select('svg').attr('width', this.#width);
+    return this;
+  }
+}"""
+
+def test_collapse_accessors_makes_one_table_of_the_get_set_methods():
+    chunks = chunk_source("tiny", TINY_GRAPH)
+    collapsed = collapse_accessors(chunks)
+    assert [chunk.title for chunk in collapsed] == ["TinyGraph file header", "TinyGraph fields",
+                                                    "TinyGraph chaining methods (width to colors)",
+                                                    "TinyGraph.render()"]
+    table = collapsed[2]
+    assert (table.name, table.start_line, table.end_line) == ("", chunks[2].start_line, chunks[3].end_line)
+    rows = table.text.split("\n")[2:]
+    assert rows == ["width(inputWidth) | #width = 720 | number | width must be a non-negative number "
+                    "| A non-negative number for the width of the graph.",
+                    "colors(inputColors) | #colors = [ 'red', 'blue' ] | any | none | "]
+
+def test_collapse_accessors_splits_tables_at_rows_per_table():
+    collapsed = collapse_accessors(chunk_source("tiny", TINY_GRAPH), rows_per_table=1)
+    assert [chunk.title for chunk in collapsed][2:4] == ["TinyGraph chaining methods (width to width)",
+                                                         "TinyGraph chaining methods (colors to colors)"]
+
+def test_error_message_fills_in_locals_and_accepted_options():
+    text = """let accepted = ['top', 'bottom'];
+    console.error('position must be ' +
+      `one of ${accepted}`);"""
+    assert error_message(text) == "position must be one of ['top', 'bottom']"
+    assert error_message("let accepted = ['a', 'b'];\nconsole.error('bad value');") == \
+        "bad value (accepted = ['a', 'b'])"
+    assert error_message("return this;") is None
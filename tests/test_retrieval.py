@@ -0,0 +1,72 @@
+"""TEST_RETRIEVAL.PY
+Tokenizing, BM25 ranking and packing chunks into a token budget.
+"""
+
+# Load libraries
+from chunking import Chunk
+from retrieval import ContextIndex, estimate_tokens, format_chunk, is_reference, pack_chunks, tokenize
+
+
+
+def source_chunk(name: str, lines: int, graph_type: str = "bar") -> Chunk:
+    text = "\n".join(f"  this.#{name} = {i};" for i in range(lines))
+    return Chunk(graph_type, "source", f"BarGraph.{name}()", text, 1, lines, "BarGraph", name, f"{name}()")
+
+def cost(chunk: Chunk) -> int:
+    return estimate_tokens(format_chunk(chunk, label=True)) + 1
+
+
+# tokenize
+
+def test_tokenize_splits_identifiers_and_keeps_them_whole():
+    assert tokenize("legendCircleSpacing") == ["legendcirclespacing", "legend", "circle", "spacing"]
+    assert tokenize("x_axis_label") == ["x_axis_label", "x", "axis", "label"]
+
+def test_tokenize_drops_stop_words_and_plurals():
+    assert tokenize("How do I set the colors of the bars?") == ["set", "color", "bar"]
+
+def test_tokenize_keeps_short_words_and_words_ending_in_ss():
+    assert tokenize("axis class gas bus") == ["axis", "class", "gas", "bus"]
+
+
+# pack_chunks
+
+def test_pack_chunks_stays_within_budget():
+    ranked = [source_chunk(f"field{i}", 10) for i in range(20)]
+    budget = 3 * cost(ranked[0])
+    packing = pack_chunks(ranked, budget)
+    assert packing.selected == ranked[:3]
+    assert packing.dropped == ranked[3:]
+    assert packing.tokens == sum(cost(chunk) for chunk in packing.selected) <= budget
+
+def test_pack_chunks_fills_space_left_by_a_chunk_that_doesnt_fit():
+    small, big, smaller = source_chunk("small", 5), source_chunk("big", 200), source_chunk("smaller", 2)
+    packing = pack_chunks([small, big, smaller], cost(small) + cost(smaller))
+    assert packing.selected == [small, smaller]
+    assert packing.dropped == [big]
+
+def test_pack_chunks_with_no_budget_drops_everything():
+    ranked = [source_chunk("a", 1), source_chunk("b", 1)]
+    packing = pack_chunks(ranked, 0)
+    assert packing.selected == [] and packing.dropped == ranked and packing.tokens == 0
+
+
+# ContextIndex
+
+def test_search_ranks_the_chunk_about_the_question_first():
+    chunks = [Chunk("bar", "source", "BarGraph.barPadding(inputPadding)", "this.#barPadding = inputPadding;", 1, 1,
+                    "BarGraph", "barPadding"),
+              Chunk("bar", "source", "BarGraph.width(inputWidth)", "this.#width = inputWidth;", 2, 2,
+                    "BarGraph", "width"),
+              Chunk("line", "source", "LineGraph.width(inputWidth)", "this.#width = inputWidth;", 1, 1,
+                    "LineGraph", "width")]
+    index = ContextIndex(chunks)
+    assert index.search("how do I change the bar padding", 1)[0][1] is chunks[0]
+    assert [chunk for score, chunk in index.search("width", 5, graph_types={"line"})] == [chunks[2]]
+    assert index.search("padding", 5, exclude=lambda chunk: chunk.name == "barPadding") == []
+
+def test_reference_chunks_are_documentation_and_source_between_methods():
+    method = source_chunk("width", 3)
+    fields = Chunk("bar", "source", "BarGraph fields", "  #width = 720;", 2, 2, "BarGraph")
+    documentation = Chunk("bar", "documentation", "Usage", "Call init() first.", 1, 1)
+    assert [is_reference(chunk) for chunk in (method, fields, documentation)] == [False, True, True]
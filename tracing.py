@@ -0,0 +1,133 @@
+"""TRACING.PY
+Times each stage of answering a question (loading the corpus, retrieval, prompt assembly,
+sending the request, time to first token, streaming, rendering) as nested spans. The
+current span is kept in a context variable, so spans started anywhere while a question
+is answered, threads and async tasks included, end up in the same trace. Finished spans
+go to pluggable exporters, like a JSON lines file or an in-memory ring buffer.
+"""
+
+# Load libraries
+import json
+import time
+import uuid
+import threading
+import contextvars
+from collections import deque
+
+
+
+current_span = contextvars.ContextVar("current_span", default=None)
+exporters = []
+
+class Span:
+    # Used as a context manager: the span is the current one inside the `with`
+    # and ends when it exits. `parent` defaults to the current span.
+    __slots__ = ("name", "trace_id", "span_id", "parent", "parent_id", "attributes", "start", "wall_start",
+                 "duration")
+
+    def __init__(self, name: str, parent=None, **attributes):
+        parent = parent or current_span.get()
+        self.name = name
+        self.trace_id = parent.trace_id if parent else uuid.uuid4().hex[:16]
+        self.span_id = uuid.uuid4().hex[:8]
+        self.parent = parent
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.start = time.perf_counter()
+        self.wall_start = time.time()
+        self.duration = None
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def end(self):
+        if self.duration is None:
+            self.duration = time.perf_counter() - self.start
+            export(self.to_dict())
+
+    def to_dict(self) -> dict:
+        return {"trace_id": self.trace_id, "span_id": self.span_id, "parent_id": self.parent_id, "name": self.name,
+                "start": round(self.wall_start, 6), "duration_s": round(self.duration or 0.0, 6),
+                "attributes": self.attributes}
+
+    def __enter__(self):
+        current_span.set(self)
+        return self
+
+    def __exit__(self, kind, error, traceback):
+        if error is not None:
+            self.attributes["error"] = f"{kind.__name__}: {error}"
+        self.end()
+        # Set rather than reset with a token: an async generator can end in another task's context
+        current_span.set(self.parent)
+        return False
+
+def span(name: str, parent: Span = None, **attributes) -> Span:
+    return Span(name, parent, **attributes)
+
+def record(name: str, duration: float, parent: Span = None, **attributes):
+    # A span for time measured elsewhere, like the total time spent rendering an answer in pieces
+    finished = Span(name, parent, **attributes)
+    finished.wall_start -= duration
+    finished.duration = duration
+    export(finished.to_dict())
+
+
+# Exporters
+
+def export(finished: dict):
+    for exporter in exporters:
+        exporter.export(finished)
+
+def add_exporter(exporter):
+    exporters.append(exporter)
+    return exporter
+
+class JsonLinesExporter:
+    # Appends one JSON line per span to a file
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, finished: dict):
+        line = json.dumps(finished) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+class RingBufferExporter:
+    # Keeps the last `size` spans in memory
+    def __init__(self, size: int = 10000):
+        self._spans = deque(maxlen=size)
+
+    def export(self, finished: dict):
+        self._spans.append(finished)
+
+    def spans(self, trace_id: str = None) -> list:
+        return [finished for finished in list(self._spans) if trace_id is None or finished["trace_id"] == trace_id]
+
+def stage_summary(spans: list) -> dict:
+    # Total seconds per span name, e.g. to log where a question's time went
+    totals = {}
+    for finished in spans:
+        totals[finished["name"]] = round(totals.get(finished["name"], 0.0) + finished["duration_s"], 4)
+    return totals
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Summarizes a JSON lines trace file: how long each stage takes")
+    parser.add_argument("path", help="A file written by JsonLinesExporter")
+    args = parser.parse_args()
+
+    durations = {}
+    with open(args.path) as f:
+        for line in f:
+            finished = json.loads(line)
+            durations.setdefault(finished["name"], []).append(finished["duration_s"])
+    for name, values in sorted(durations.items(), key=lambda item: -sum(item[1])):
+        values.sort()
+        print(json.dumps({"stage": name, "count": len(values), "total_s": round(sum(values), 3),
+                          "p50_s": values[len(values) // 2], "p95_s": values[min(len(values) - 1, int(len(values) * 0.95))]}))
@@ -0,0 +1,124 @@
+"""USAGE.PY
+Keeps a ledger of the tokens every question used (input, output, and prompt cache writes
+and reads) with what it cost, in SQLite next to the answer cache. Totals per graph type,
+per Streamlit session and per day show where context reduction pays off most.
+"""
+
+# Load libraries
+import time
+import sqlite3
+
+from cache import Database
+
+
+
+# US dollars per million tokens: input, output, prompt cache write, prompt cache read
+PRICES = {
+    "claude-3-haiku-20240307": (0.25, 1.25, 0.30, 0.03),
+    "claude-3-5-sonnet-20240620": (3.00, 15.00, 3.75, 0.30),
+    "claude-3-opus-20240229": (15.00, 75.00, 18.75, 1.50),
+}
+
+TOKEN_KINDS = ("input_tokens", "output_tokens", "cache_creation_input_tokens", "cache_read_input_tokens")
+GROUPS = ("graph_type", "session", "day", "source", "model")
+
+def cost(model: str, usage: dict) -> float:
+    prices = PRICES.get(model, (0.0, 0.0, 0.0, 0.0))
+    return sum(usage.get(kind, 0) * price for kind, price in zip(TOKEN_KINDS, prices)) / 1e6
+
+
+class UsageLedger(Database):
+    def __init__(self, path: str):
+        super().__init__(path)
+        with self._connection() as db:
+            db.execute("""CREATE TABLE IF NOT EXISTS usage (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created REAL NOT NULL,
+                day TEXT NOT NULL,
+                session TEXT NOT NULL,
+                graph_type TEXT NOT NULL,
+                source TEXT NOT NULL,
+                model TEXT NOT NULL,
+                input_tokens INTEGER NOT NULL,
+                output_tokens INTEGER NOT NULL,
+                cache_creation_input_tokens INTEGER NOT NULL,
+                cache_read_input_tokens INTEGER NOT NULL,
+                cost REAL NOT NULL
+            )""")
+            db.execute("CREATE INDEX IF NOT EXISTS usage_day ON usage (day)")
+            db.execute("CREATE INDEX IF NOT EXISTS usage_session ON usage (session)")
+
+    def record(self, session: str, graph_type: str, source: str, model: str, usage: dict):
+        # source is where the answer came from: 'model', 'exact' or 'semantic' cache, or 'fast_path'
+        now = time.time()
+        tokens = [int(usage.get(kind) or 0) for kind in TOKEN_KINDS]
+        with self._connection() as db:
+            db.execute("INSERT INTO usage (created, day, session, graph_type, source, model, input_tokens, output_tokens, "
+                       "cache_creation_input_tokens, cache_read_input_tokens, cost) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                       [now, time.strftime("%Y-%m-%d", time.localtime(now)), session or "", graph_type, source, model]
+                       + tokens + [cost(model, usage)])
+
+    def stats(self, by: str = "graph_type", since: str = None, session: str = None) -> list:
+        # Questions, tokens and cost per graph type, session, day, source or model,
+        # most expensive first. since is a 'YYYY-MM-DD' day.
+        if by not in GROUPS:
+            raise ValueError(f"Can't group usage by {by!r}, use one of {', '.join(GROUPS)}")
+        where, params = [], []
+        if since:
+            where.append("day >= ?")
+            params.append(since)
+        if session:
+            where.append("session = ?")
+            params.append(session)
+        rows = self._connection().execute(
+            f"SELECT {by}, COUNT(*), SUM(source = 'model'), {', '.join(f'SUM({kind})' for kind in TOKEN_KINDS)}, SUM(cost) "
+            f"FROM usage {'WHERE ' + ' AND '.join(where) if where else ''} GROUP BY {by} ORDER BY SUM(cost) DESC",
+            params).fetchall()
+        stats = []
+        for key, questions, model_calls, *tokens, total in rows:
+            row = {by: key, "questions": questions, "model_calls": model_calls}
+            row.update(zip(TOKEN_KINDS, tokens))
+            row["cost_usd"] = round(total, 6)
+            row["cost_per_question_usd"] = round(total / questions, 6)
+            stats.append(row)
+        return stats
+
+    def totals(self, since: str = None, session: str = None) -> dict:
+        rows = self.stats("model", since, session)
+        totals = {"questions": 0, "model_calls": 0, "cost_usd": 0.0}
+        totals.update((kind, 0) for kind in TOKEN_KINDS)
+        for row in rows:
+            for key in totals:
+                totals[key] += row[key]
+        totals["cost_usd"] = round(totals["cost_usd"], 6)
+        return totals
+
+
+if __name__ == "__main__":
+    import json
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Reports the tokens and cost of the questions asked so far")
+    parser.add_argument("--db", help="The usage ledger", type=str, default="justin_usage.db")
+    parser.add_argument("--by", help="What to group by", choices=GROUPS, default="graph_type")
+    parser.add_argument("--since", help="Only questions from this day on (YYYY-MM-DD)", type=str)
+    parser.add_argument("--session", help="Only questions from this session", type=str)
+    parser.add_argument("--json", help="Print JSON lines instead of a table", action="store_true")
+    args = parser.parse_args()
+
+    try:
+        ledger = UsageLedger(args.db)
+        rows = ledger.stats(args.by, args.since, args.session)
+    except sqlite3.Error as error:
+        parser.error(f"can't read {args.db}: {error}")
+
+    if args.json:
+        for row in rows:
+            print(json.dumps(row))
+        print(json.dumps({"total": ledger.totals(args.since, args.session)}))
+    else:
+        columns = [args.by, "questions", "model_calls", *TOKEN_KINDS, "cost_usd", "cost_per_question_usd"]
+        widths = [max(len(column), 12) for column in columns]
+        print("  ".join(column.rjust(width) for column, width in zip(columns, widths)))
+        for row in rows + [dict(ledger.totals(args.since, args.session), **{args.by: "total", "cost_per_question_usd": ""})]:
+            print("  ".join(str(row[column]).rjust(width) for column, width in zip(columns, widths)))